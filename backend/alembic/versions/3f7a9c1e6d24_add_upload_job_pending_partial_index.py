@@ -0,0 +1,37 @@
+"""add upload_job pending partial index
+
+Revision ID: 3f7a9c1e6d24
+Revises: 8c41d2f0b5a9
+Create Date: 2026-08-30 09:48:55.331207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f7a9c1e6d24'
+down_revision: Union[str, Sequence[str], None] = '8c41d2f0b5a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keeps the pending-jobs polling query on a small index that covers only
+    # in-flight rows; the full (status, created_at) composite already exists
+    # for the general filtered listing.
+    op.create_index(
+        'ix_upload_job_pending',
+        'upload_job',
+        ['created_at'],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'")
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_upload_job_pending', table_name='upload_job')
@@ -0,0 +1,35 @@
+"""add upload_job created_id index
+
+Revision ID: 8c41d2f0b5a9
+Revises: 71a240e65e7f
+Create Date: 2026-08-30 09:40:12.104582
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c41d2f0b5a9'
+down_revision: Union[str, Sequence[str], None] = '71a240e65e7f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Supports keyset pagination of the jobs listing:
+    # ORDER BY created_at DESC, id DESC with a (created_at, id) < (c, i) seek.
+    op.create_index(
+        'ix_upload_job_created_id',
+        'upload_job',
+        ['created_at', 'id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_upload_job_created_id', table_name='upload_job')
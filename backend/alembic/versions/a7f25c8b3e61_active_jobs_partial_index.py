@@ -0,0 +1,41 @@
+"""active jobs partial index
+
+Revision ID: a7f25c8b3e61
+Revises: e4b60a2d9c18
+Create Date: 2026-08-30 12:14:55.602318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7f25c8b3e61'
+down_revision: Union[str, Sequence[str], None] = 'e4b60a2d9c18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The full composite indexed every terminal row; the partial only
+    # carries pending/processing, which is what status polling reads.
+    op.drop_index('idx_upload_job_status_created', table_name='upload_job')
+    op.create_index(
+        'idx_upload_job_active',
+        'upload_job',
+        ['created_at'],
+        postgresql_where=sa.text("status IN ('pending', 'processing')")
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_upload_job_active', table_name='upload_job')
+    op.create_index(
+        'idx_upload_job_status_created',
+        'upload_job',
+        ['status', 'created_at']
+    )
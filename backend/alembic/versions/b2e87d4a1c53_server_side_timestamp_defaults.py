@@ -0,0 +1,56 @@
+"""server-side timestamp defaults
+
+Revision ID: b2e87d4a1c53
+Revises: 3f7a9c1e6d24
+Create Date: 2026-08-30 10:21:40.775913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2e87d4a1c53'
+down_revision: Union[str, Sequence[str], None] = '3f7a9c1e6d24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLES = ('employee', 'project', 'upload_job')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # created_at/updated_at are now filled by PostgreSQL on INSERT instead
+    # of a per-row client-side utcnow() binding.
+    for table in _TABLES:
+        op.alter_column(
+            table, 'created_at',
+            server_default=sa.func.now(),
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=False
+        )
+        op.alter_column(
+            table, 'updated_at',
+            server_default=sa.func.now(),
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=False
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in _TABLES:
+        op.alter_column(
+            table, 'created_at',
+            server_default=None,
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=False
+        )
+        op.alter_column(
+            table, 'updated_at',
+            server_default=None,
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=False
+        )
@@ -0,0 +1,40 @@
+"""employee salary not null
+
+Revision ID: b9e53a7d4f26
+Revises: f5a18d3c6e92
+Create Date: 2026-08-30 13:40:19.473582
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9e53a7d4f26'
+down_revision: Union[str, Sequence[str], None] = 'f5a18d3c6e92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The ingestion validator has always rejected rows without a salary,
+    # so no NULLs should exist; the UPDATE is a safety net for rows that
+    # predate validation.
+    op.execute("UPDATE employee SET salary = 0 WHERE salary IS NULL")
+    op.alter_column(
+        'employee', 'salary',
+        existing_type=sa.Float(),
+        nullable=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'employee', 'salary',
+        existing_type=sa.Float(),
+        nullable=True
+    )
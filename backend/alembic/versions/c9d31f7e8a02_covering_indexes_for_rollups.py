@@ -0,0 +1,41 @@
+"""covering indexes for rollups
+
+Revision ID: c9d31f7e8a02
+Revises: b2e87d4a1c53
+Create Date: 2026-08-30 11:05:12.318467
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9d31f7e8a02'
+down_revision: Union[str, Sequence[str], None] = 'b2e87d4a1c53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # INCLUDE columns make department/status rollups index-only scans.
+    op.create_index(
+        'ix_employee_dept_covering',
+        'employee',
+        ['department_code'],
+        postgresql_include=['annual_salary_eur', 'tenure_years']
+    )
+    op.create_index(
+        'ix_project_status_budget',
+        'project',
+        ['status'],
+        postgresql_include=['budget_usd']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_project_status_budget', table_name='project')
+    op.drop_index('ix_employee_dept_covering', table_name='employee')
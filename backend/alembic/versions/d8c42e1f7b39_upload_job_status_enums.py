@@ -0,0 +1,63 @@
+"""upload job status enums
+
+Revision ID: d8c42e1f7b39
+Revises: a7f25c8b3e61
+Create Date: 2026-08-30 12:41:28.190754
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8c42e1f7b39'
+down_revision: Union[str, Sequence[str], None] = 'a7f25c8b3e61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_STATUS_VALUES = ('pending', 'processing', 'completed', 'failed')
+_STEP_VALUES = ('reading', 'validating', 'transforming', 'persisting', 'completed')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    status_enum = sa.Enum(*_STATUS_VALUES, name='upload_status')
+    step_enum = sa.Enum(*_STEP_VALUES, name='upload_step')
+    status_enum.create(op.get_bind())
+    step_enum.create(op.get_bind())
+
+    op.alter_column(
+        'upload_job', 'status',
+        type_=status_enum,
+        existing_type=sa.String(length=50),
+        existing_nullable=False,
+        postgresql_using='status::upload_status'
+    )
+    op.alter_column(
+        'upload_job', 'current_step',
+        type_=step_enum,
+        existing_type=sa.String(length=50),
+        existing_nullable=True,
+        postgresql_using='current_step::upload_step'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'upload_job', 'current_step',
+        type_=sa.String(length=50),
+        existing_type=sa.Enum(*_STEP_VALUES, name='upload_step'),
+        existing_nullable=True,
+        postgresql_using='current_step::text'
+    )
+    op.alter_column(
+        'upload_job', 'status',
+        type_=sa.String(length=50),
+        existing_type=sa.Enum(*_STATUS_VALUES, name='upload_status'),
+        existing_nullable=False,
+        postgresql_using='status::text'
+    )
+    sa.Enum(name='upload_step').drop(op.get_bind())
+    sa.Enum(name='upload_status').drop(op.get_bind())
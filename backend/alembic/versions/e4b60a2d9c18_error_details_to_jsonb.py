@@ -0,0 +1,41 @@
+"""error_details to jsonb
+
+Revision ID: e4b60a2d9c18
+Revises: c9d31f7e8a02
+Create Date: 2026-08-30 11:32:07.854201
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b60a2d9c18'
+down_revision: Union[str, Sequence[str], None] = 'c9d31f7e8a02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        'upload_job', 'error_details',
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        existing_nullable=True,
+        postgresql_using='error_details::jsonb'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'upload_job', 'error_details',
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using='error_details::json'
+    )
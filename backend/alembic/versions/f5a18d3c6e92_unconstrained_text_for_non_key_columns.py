@@ -0,0 +1,51 @@
+"""unconstrained text for non-key columns
+
+Revision ID: f5a18d3c6e92
+Revises: d8c42e1f7b39
+Create Date: 2026-08-30 13:02:46.927135
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5a18d3c6e92'
+down_revision: Union[str, Sequence[str], None] = 'd8c42e1f7b39'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, old varchar length) — business keys keep their caps.
+_COLUMNS = (
+    ('employee', 'name', 300),
+    ('employee', 'department_code', 50),
+    ('employee', 'department_name', 200),
+    ('project', 'project_name', 200),
+    ('project', 'status', 50),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # varchar(n) -> text: same storage in PG, drops the per-row length
+    # check that bulk loads otherwise evaluate for every inserted value.
+    for table, column, length in _COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.Text(),
+            existing_type=sa.String(length=length),
+            existing_nullable=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column, length in _COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.String(length=length),
+            existing_type=sa.Text(),
+            existing_nullable=True
+        )
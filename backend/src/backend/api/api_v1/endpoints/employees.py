@@ -1,26 +1,28 @@
 """Employee API endpoints."""
 
 import math
+import uuid
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Query, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from backend.db.session import get_db
 from backend.crud.employee_crud import employee_crud
-from backend.schemas.employee import EmployeeInDB
-from backend.schemas.common import (
-    BaseResponse,
-    BaseErrorResponse,
-    PaginatedResponse
-)
+from backend.schemas.employee import employee_from_row
+from backend.schemas.common import BaseErrorResponse
+from backend.schemas.concrete import EmployeePage, EmployeePageResponse
 
 router = APIRouter(prefix="/employees", tags=["Employees"])
 
 
 @router.get(
     "",
-    response_model=BaseResponse[PaginatedResponse[EmployeeInDB]],
+    # response_model=None: outbound payloads are built from trusted DB rows
+    # and dumped below; skipping FastAPI's response re-validation is one of
+    # the larger constant costs on big pages.
+    response_model=None,
     status_code=status.HTTP_200_OK,
     summary="Get employees list",
     description="""
@@ -80,7 +82,7 @@ router = APIRouter(prefix="/employees", tags=["Employees"])
     responses={
         200: {
             "description": "Successful response with paginated employee list",
-            "model": BaseResponse[PaginatedResponse[EmployeeInDB]]
+            "model": EmployeePageResponse
         },
         400: {
             "description": "Bad request (invalid query parameters)",
@@ -111,23 +113,31 @@ async def get_employees(
             description="Filter by department name",
             example="Human Resources"
         ),
+        after_id: Optional[uuid.UUID] = Query(
+            default=None,
+            description="Keyset cursor: return employees after this ID "
+                        "(skips the total count query on large tables)"
+        ),
         db: Session = Depends(get_db)
-) -> BaseResponse[PaginatedResponse[EmployeeInDB]]:
+) -> ORJSONResponse:
     """Get paginated list of employees with optional department filter.
 
     Flow:
     1. Build filters dictionary from query parameters
-    2. Get employees using base CRUD method (get_multi_with_filter)
-    3. Get total count using base CRUD method (count_with_filter)
-    4. Convert to EmployeeInDB schemas
-    5. Calculate pagination metadata
-    6. Wrap in PaginatedResponse
-    7. Wrap in BaseResponse for consistency
+    2. Get employees and total count in one query (get_multi_with_count),
+       or seek past after_id with no count when a cursor is provided
+    3. Convert to EmployeeInDB schemas
+    4. Calculate pagination metadata
+    5. Wrap in PaginatedResponse
+    6. Wrap in BaseResponse for consistency
 
     Args:
-        page: Page number (1-indexed).
+        page: Page number (1-indexed). Ignored when after_id is provided.
         size: Number of items per page.
         department: Optional department name filter.
+        after_id: Optional keyset cursor (ID of last employee on the
+            previous page). When set, the expensive COUNT is skipped and
+            next_cursor is returned instead of an exact total/pages.
         db: Database session (injected by FastAPI).
 
     Returns:
@@ -138,41 +148,53 @@ async def get_employees(
         HTTPException 500: If database error occurs.
     """
     try:
-        skip = (page - 1) * size
-
         filters = {}
         if department:
             filters["department_name"] = department
 
-        employees = employee_crud.get_multi_with_filter(
-            db,
-            filters=filters if filters else None,
-            skip=skip,
-            limit=size
-        )
-
-        total = employee_crud.count_with_filter(
-            db,
-            filters=filters if filters else None
-        )
-
-        items = [EmployeeInDB.model_validate(emp) for emp in employees]
-
-        pages = math.ceil(total / size) if total > 0 else 0
-
-        paginated_data = PaginatedResponse[EmployeeInDB](
+        next_cursor = None
+        if after_id is not None:
+            # Keyset mode: O(page size) seek, no full-scan count.
+            employees, cursor = employee_crud.get_multi_keyset(
+                db,
+                filters=filters if filters else None,
+                after_id=after_id,
+                limit=size
+            )
+            total = len(employees)
+            pages = 0
+            next_cursor = str(cursor) if cursor is not None else None
+        else:
+            skip = (page - 1) * size
+
+            employees, total = employee_crud.get_multi_with_count(
+                db,
+                filters=filters if filters else None,
+                skip=skip,
+                limit=size
+            )
+            pages = math.ceil(total / size) if total > 0 else 0
+
+        # Rows are trusted DB output; skip re-validating them per field.
+        items = [employee_from_row(emp) for emp in employees]
+
+        # model_construct all the way up: normal construction of the page
+        # wrapper would re-validate every item it carries.
+        paginated_data = EmployeePage.model_construct(
             items=items,
             total=total,
             page=page,
             size=size,
-            pages=pages
+            pages=pages,
+            next_cursor=next_cursor
         )
-
-        return BaseResponse[PaginatedResponse[EmployeeInDB]](
+        response = EmployeePageResponse.model_construct(
             success=True,
             data=paginated_data
         )
 
+        return ORJSONResponse(content=response.model_dump(mode="json"))
+
     except HTTPException:
         # Re-raise HTTP exceptions (like 404 above)
         raise
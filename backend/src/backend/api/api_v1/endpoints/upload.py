@@ -1,95 +1,189 @@
 """Upload API endpoints for file processing."""
 
+import asyncio
 import math
+import os
+import shutil
 import uuid
 from pathlib import Path as FilePath
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status, Request, UploadFile, File, Query, Path
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from backend.core.config import settings
+from backend.core.utils import uuid7
 from backend.db.session import get_db
 from backend.crud.upload_job_crud import upload_job_crud
 from backend.schemas.upload_job import (
     UploadJobCreate,
-    UploadJobInDB,
-    UploadJobResponse
+    UploadJobResponse,
+    upload_job_from_row
 )
-from backend.schemas.common import (
-    BaseResponse,
-    BaseErrorResponse,
-    PaginatedResponse
+from backend.schemas.common import BaseErrorResponse
+from backend.schemas.concrete import (
+    UploadAcceptedResponse,
+    UploadJobDetailResponse,
+    UploadJobPage,
+    UploadJobPageResponse
 )
 from backend.tasks.process_upload import process_upload_task
 
 router = APIRouter(prefix="/upload", tags=["Upload"])
 
-ALLOWED_EXTENSIONS = {".xlsx", ".xls"}
+
+ALLOWED_EXTENSIONS = (".xlsx", ".xls")
+
+#: Precomputed 400 message so the error string isn't rebuilt per request.
+_INVALID_EXTENSION_DETAIL = (
+    f"Invalid file format. Only {', '.join(ALLOWED_EXTENSIONS)} files are allowed."
+)
+
 UPLOAD_PATH = settings.UPLOAD_DIR_ABSOLUTE_PATH
 
+#: Upload size limit, read from settings once so the per-chunk limit check
+#: in save_upload_file compares against a plain module-level int.
+MAX_FILE_SIZE = settings.UPLOAD_MAX_FILE_SIZE
+
+#: Read/write chunk size for streaming uploads to disk (64 KiB).
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+#: Caps concurrent in-flight uploads per process. Each upload holds at most
+#: one chunk buffer plus the spooled temp file, so this bounds upload memory
+#: at roughly UPLOAD_MAX_CONCURRENCY * spool size instead of growing with N.
+_UPLOAD_SEMAPHORE = asyncio.Semaphore(settings.UPLOAD_MAX_CONCURRENCY)
+
 # Ensure upload directory exists
 UPLOAD_PATH.mkdir(parents=True, exist_ok=True)
 
 
 def validate_file_extension(filename: str) -> None:
-    """Validate file has allowed extension."""
-    file_ext = FilePath(filename).suffix.lower()
-    if file_ext not in ALLOWED_EXTENSIONS:
+    """Validate file has allowed extension.
+
+    Uses a single str.endswith scan instead of pathlib suffix parsing,
+    which allocates several intermediate objects per call.
+    """
+    if not filename.lower().endswith(ALLOWED_EXTENSIONS):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid file format. Only {', '.join(ALLOWED_EXTENSIONS)} files are allowed."
+            detail=_INVALID_EXTENSION_DETAIL
         )
 
 
-async def validate_file_size(file: UploadFile) -> None:
-    """Validate file size is within limits."""
-    contents = await file.read()
-    file_size = len(contents)
-    await file.seek(0)
+def _raise_too_large() -> None:
+    """Raise 400 for uploads exceeding the configured size limit."""
+    max_size_mb = MAX_FILE_SIZE / (1024 * 1024)
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"File too large. Maximum size is {max_size_mb}MB."
+    )
 
-    if file_size > settings.UPLOAD_MAX_FILE_SIZE:
-        max_size_mb = settings.UPLOAD_MAX_FILE_SIZE / (1024 * 1024)
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File too large. Maximum size is {max_size_mb}MB."
-        )
 
-    if file_size == 0:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="File is empty."
-        )
+def _persist_spooled_file(src, file_path: FilePath, size: int) -> None:
+    """Copy an already-spooled upload to its final path without re-buffering.
+
+    On Linux, uploads that spilled to disk (SpooledTemporaryFile rolled over)
+    are moved kernel-to-kernel via os.sendfile — no user-space copy at all.
+    In-memory spools fall back to shutil.copyfileobj, which still avoids
+    materializing the payload as a single bytes object.
+
+    Args:
+        src: The underlying spooled file object (UploadFile.file).
+        file_path: Destination path on disk.
+        size: Total upload size in bytes.
+    """
+    with open(file_path, "wb", buffering=UPLOAD_CHUNK_SIZE) as out:
+        if getattr(src, "_rolled", False) and hasattr(os, "sendfile"):
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(out.fileno(), src.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        else:
+            src.seek(0)
+            shutil.copyfileobj(src, out, length=UPLOAD_CHUNK_SIZE)
 
 
 async def save_upload_file(file: UploadFile) -> tuple[str, str]:
     """Save uploaded file to disk with unique filename.
 
+    When Starlette already knows the upload size, the spooled file is copied
+    straight to disk (zero-copy via sendfile where possible). Otherwise the
+    upload is streamed in fixed-size chunks, validating size limits during
+    the same pass so the file is never read twice.
+
     Returns:
         Tuple of (original_filename, saved_filename_only).
+
+    Raises:
+        HTTPException 400: If file exceeds the size limit or is empty.
+        HTTPException 500: If file cannot be written to disk.
     """
+    # Time-ordered IDs keep saved files roughly chronological on disk and
+    # match the insert-locality story of the DB primary keys.
+    file_id = uuid7()
+    file_ext = FilePath(file.filename).suffix
+    safe_filename = f"{file_id}{file_ext}"
+    file_path = UPLOAD_PATH / safe_filename
+    # Write to a .part file and os.replace() into place: the final path
+    # either doesn't exist or holds a complete workbook, so a crash
+    # mid-write can never hand the Celery worker a truncated file.
+    part_path = UPLOAD_PATH / f"{safe_filename}.part"
+
+    total_bytes = file.size
     try:
-        file_id = uuid.uuid4()
-        file_ext = FilePath(file.filename).suffix
-        safe_filename = f"{file_id}{file_ext}"
-        file_path = UPLOAD_PATH / safe_filename
-
-        contents = await file.read()
-        with open(file_path, "wb") as f:
-            f.write(contents)
+        if total_bytes is not None:
+            if total_bytes > MAX_FILE_SIZE:
+                _raise_too_large()
+            # Run the blocking copy in the threadpool so concurrent requests
+            # aren't stalled behind a multi-MB disk write on the event loop.
+            await asyncio.to_thread(
+                _persist_spooled_file, file.file, part_path, total_bytes
+            )
+        else:
+            # Size unknown: stream in chunks and enforce the limit inline.
+            total_bytes = 0
+            # Buffer size matches UPLOAD_CHUNK_SIZE so each chunk read maps
+            # to one buffered write, minimizing syscalls on multi-MB uploads.
+            with open(part_path, "wb", buffering=UPLOAD_CHUNK_SIZE) as f:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    total_bytes += len(chunk)
+                    if total_bytes > MAX_FILE_SIZE:
+                        _raise_too_large()
+                    f.write(chunk)
 
-        return file.filename, safe_filename  # Return only filename, not full path
+    except HTTPException:
+        # Size limit tripped mid-stream: drop the partial file so the
+        # worker never sees a truncated workbook.
+        part_path.unlink(missing_ok=True)
+        raise
 
     except Exception as e:
+        part_path.unlink(missing_ok=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to save file: {str(e)}"
         )
 
+    if total_bytes == 0:
+        part_path.unlink(missing_ok=True)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File is empty."
+        )
+
+    # Atomic publish; no fsync — Excel imports are re-uploadable, so we
+    # trade durability-on-power-loss for not stalling on flush.
+    os.replace(part_path, file_path)
+
+    return file.filename, safe_filename  # Return only filename, not full path
+
 
 @router.post(
     "",
-    response_model=BaseResponse[UploadJobResponse],
+    response_model=UploadAcceptedResponse,
     status_code=status.HTTP_202_ACCEPTED,
     summary="Upload Excel file for processing"
 )
@@ -97,13 +191,13 @@ async def upload_file(
         request: Request,
         file: UploadFile = File(..., description="Excel file (.xlsx or .xls)"),
         db: Session = Depends(get_db)
-) -> BaseResponse[UploadJobResponse]:
+) -> UploadAcceptedResponse:
     """Upload Excel file for asynchronous processing."""
     try:
         validate_file_extension(file.filename)
-        await validate_file_size(file)
 
-        original_filename, saved_filename = await save_upload_file(file)
+        async with _UPLOAD_SEMAPHORE:
+            original_filename, saved_filename = await save_upload_file(file)
 
         job_data = UploadJobCreate(
             filename=original_filename,
@@ -121,7 +215,7 @@ async def upload_file(
             message="File uploaded successfully. Processing started."
         )
 
-        return BaseResponse[UploadJobResponse](
+        return UploadAcceptedResponse(
             success=True,
             data=response_data
         )
@@ -138,39 +232,80 @@ async def upload_file(
 
 @router.get(
     "/jobs",
-    response_model=BaseResponse[PaginatedResponse[UploadJobInDB]],
+    # response_model=None: payloads below are built from trusted DB rows
+    # and dumped manually, skipping FastAPI's outbound re-validation.
+    response_model=None,
     status_code=status.HTTP_200_OK,
-    summary="Get upload jobs list"
+    summary="Get upload jobs list",
+    responses={200: {"model": UploadJobPageResponse}}
 )
 async def get_upload_jobs(
         page: int = Query(default=1, ge=1),
         size: int = Query(default=20, ge=1, le=100),
-        status: Optional[str] = Query(default=None),
+        # Aliased so the parameter doesn't shadow the fastapi.status
+        # module used by the error handlers below.
+        status_filter: Optional[str] = Query(default=None, alias="status"),
+        cursor: Optional[str] = Query(
+            default=None,
+            description="Keyset cursor from a previous page's next_cursor; "
+                        "skips OFFSET scanning and the total count query"
+        ),
         db: Session = Depends(get_db)
-) -> BaseResponse[PaginatedResponse[UploadJobInDB]]:
+) -> ORJSONResponse:
     """Get paginated list of upload jobs."""
     try:
-        skip = (page - 1) * size
-        filters = {"status": status} if status else None
-
-        jobs = upload_job_crud.get_jobs_ordered(db, filters=filters, skip=skip, limit=size)
-        total = upload_job_crud.count_with_filter(db, filters=filters)
-        items = [UploadJobInDB.model_validate(job) for job in jobs]
-        pages = math.ceil(total / size) if total > 0 else 0
-
-        paginated_data = PaginatedResponse[UploadJobInDB](
+        filters = {"status": status_filter} if status_filter else None
+
+        next_cursor = None
+        if cursor is not None:
+            try:
+                jobs, next_cursor = upload_job_crud.get_jobs_keyset(
+                    db, filters=filters, cursor=cursor, limit=size
+                )
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=400,
+                    detail=str(e)
+                )
+            total = len(jobs)
+            pages = 0
+        else:
+            skip = (page - 1) * size
+            # Read-only listing: plain row mappings, no ORM materialization
+            jobs, total = upload_job_crud.list_jobs(
+                db, filters=filters, skip=skip, limit=size
+            )
+            pages = math.ceil(total / size) if total > 0 else 0
+            # Hand out a cursor so clients can switch to keyset paging for
+            # the pages after this one.
+            if jobs and (skip + len(jobs)) < total:
+                last = jobs[-1]
+                next_cursor = upload_job_crud.encode_cursor(
+                    last["created_at"], last["id"]
+                )
+
+        # Rows are trusted DB output; construct without re-validation and
+        # dump once at the end.
+        items = [upload_job_from_row(j) for j in jobs]
+
+        paginated_data = UploadJobPage.model_construct(
             items=items,
             total=total,
             page=page,
             size=size,
-            pages=pages
+            pages=pages,
+            next_cursor=next_cursor
         )
-
-        return BaseResponse[PaginatedResponse[UploadJobInDB]](
+        response = UploadJobPageResponse.model_construct(
             success=True,
             data=paginated_data
         )
 
+        return ORJSONResponse(content=response.model_dump(mode="json"))
+
+    except HTTPException:
+        raise
+
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -180,14 +315,15 @@ async def get_upload_jobs(
 
 @router.get(
     "/status/{job_id}",
-    response_model=BaseResponse[UploadJobInDB],
+    response_model=None,
     status_code=status.HTTP_200_OK,
-    summary="Get upload job status"
+    summary="Get upload job status",
+    responses={200: {"model": UploadJobDetailResponse}}
 )
 async def get_upload_job_status(
         job_id: str = Path(...),
         db: Session = Depends(get_db)
-) -> BaseResponse[UploadJobInDB]:
+) -> ORJSONResponse:
     """Get detailed status of a specific upload job."""
     try:
         try:
@@ -206,12 +342,13 @@ async def get_upload_job_status(
                 detail=f"Upload job with ID {job_id} not found"
             )
 
-        job_data = UploadJobInDB.model_validate(job)
+        job_data = upload_job_from_row(job)
 
-        return BaseResponse[UploadJobInDB](
+        response = UploadJobDetailResponse.model_construct(
             success=True,
             data=job_data
         )
+        return ORJSONResponse(content=response.model_dump(mode="json"))
 
     except HTTPException:
         raise
@@ -26,6 +26,13 @@ celery_app.conf.update(
     result_expires=3600,  # Results expire after 1 hour
     result_extended=True,  # Store additional task metadata
 
+    # Task routing
+    task_routes={
+        # Keep upload processing on its own queue so bursts of uploads
+        # can't starve any future task types sharing the default queue.
+        "backend.tasks.process_upload.*": {"queue": "uploads"},
+    },
+
     # Worker settings
     worker_prefetch_multiplier=1,  # Process one task at a time
     worker_max_tasks_per_child=1000,  # Restart worker after 1000 tasks (prevent memory leaks)
@@ -1,3 +1,4 @@
+import functools
 import pathlib
 from typing import List, Optional
 from enum import Enum
@@ -26,7 +27,6 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=True,
         extra="ignore",
-        validate_assignment=True,
         use_enum_values=True,
         str_strip_whitespace=True,
     )
@@ -37,6 +37,9 @@ class Settings(BaseSettings):
     DB_NAME: str
     DB_USER: str
     DB_PASSWORD: SecretStr
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_PRE_PING: bool = True
 
     # --- Timezone and datetime format ---
     TIMEZONE: str = "UTC"
@@ -58,6 +61,7 @@ class Settings(BaseSettings):
     # --- File Upload Settings ---
     UPLOAD_DIR: str = "/tmp/uploads"
     UPLOAD_MAX_FILE_SIZE: int = 10485760  # 10MB in bytes
+    UPLOAD_MAX_CONCURRENCY: int = 8  # Max in-flight uploads per API process
 
     # --- Celery / Redis Settings ---
     CELERY_BROKER_URL: str = "redis://redis:6379/0"
@@ -73,7 +77,7 @@ class Settings(BaseSettings):
             raise ValueError('DB_PORT must be between 1 and 65535')
         return v
 
-    @property
+    @functools.cached_property
     def cors_origins_list(self) -> List[str]:
         """Parse CORS origins from string to list.
 
@@ -89,7 +93,7 @@ class Settings(BaseSettings):
             return []
         return [origin.strip() for origin in self.CORS_ALLOWED_ORIGINS.split(",") if origin.strip()]
 
-    @property
+    @functools.cached_property
     def allowed_hosts_list(self) -> List[str]:
         """Parse allowed hosts from string to list.
 
@@ -112,7 +116,7 @@ class Settings(BaseSettings):
             return ["*"]  # Default to allow all if not configured
         return [host.strip() for host in self.ALLOWED_HOSTS.split(",") if host.strip()]
 
-    @property
+    @functools.cached_property
     def DATABASE_URL(self) -> str:
         """Generate database URL for SQLAlchemy.
 
@@ -143,7 +147,7 @@ class Settings(BaseSettings):
         """
         return self.APP_MODE == AppMode.PRODUCTION
 
-    @property
+    @functools.cached_property
     def CONFIG_CSV_ABSOLUTE_PATH(self) -> pathlib.Path:
         """Get absolute path to config.csv file.
 
@@ -157,7 +161,7 @@ class Settings(BaseSettings):
         # We need /application_root/config/config.csv
         return ROOT.parent.parent / self.CONFIG_CSV_PATH
 
-    @property
+    @functools.cached_property
     def UPLOAD_DIR_ABSOLUTE_PATH(self) -> pathlib.Path:
         """Get absolute path to upload directory.
 
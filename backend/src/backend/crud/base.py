@@ -1,10 +1,14 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+import itertools
+from typing import Any, Dict, Generic, List, Optional, Tuple, Type, TypeVar, Union
 
-from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
+from sqlalchemy import func, insert, inspect, literal_column, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from backend.db.base_class import Base
+from backend.db.session import BULK_BATCH_SIZE
+from backend.services.bulk_copy import COPY_MIN_ROWS, copy_upsert, copy_upsert_df
 
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
@@ -19,8 +23,12 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
     Attributes:
         model: The SQLAlchemy model class this CRUD instance operates on.
+        business_key: Optional natural-key column name (e.g. "employee_id")
+            enabling the upsert helpers. None disables upserts.
     """
 
+    business_key: Optional[str] = None
+
     def __init__(self, model: Type[ModelType]):
         """Initialize CRUD operations for a specific model.
 
@@ -28,6 +36,36 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             model: SQLAlchemy model class to perform CRUD operations on.
         """
         self.model = model
+        # Resolve filterable columns once at construction; looking them up
+        # via getattr(model, name) per query re-runs SQLAlchemy's
+        # InstrumentedAttribute descriptor for every filter.
+        self._cols = {
+            attr.key: getattr(model, attr.key)
+            for attr in inspect(model).mapper.column_attrs
+        }
+        # One insert() construct per model, built once. Reusing the same
+        # statement object across calls lets the engine's compiled cache hit
+        # on identity instead of re-deriving the cache key per batch.
+        self._insert_stmt = insert(model)
+
+    def _filter_col(self, attr_name: str):
+        """Resolve a filter attribute name to its mapped column.
+
+        Args:
+            attr_name: Name of the model attribute to filter by.
+
+        Returns:
+            The InstrumentedAttribute for the column.
+
+        Raises:
+            ValueError: If the attribute is not a mapped column.
+        """
+        col = self._cols.get(attr_name)
+        if col is None:
+            raise ValueError(
+                f"Unknown filter attribute '{attr_name}' for {self.model.__name__}"
+            )
+        return col
 
     def get(self, db: Session, id_value: Any) -> Optional[ModelType]:
         """Get a single record by primary key ID.
@@ -39,7 +77,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             Model instance if found, None otherwise.
         """
-        return db.query(self.model).filter(self.model.id == id_value).first()  # type: ignore
+        return db.get(self.model, id_value)
 
     def get_by_attribute(
             self,
@@ -61,7 +99,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             Returns only the first match. For multiple results, use a custom
             query or extend this method in your CRUD class.
         """
-        return db.query(self.model).filter(getattr(self.model, attr_name) == attr_value).first()  # type: ignore
+        stmt = select(self.model).where(self._filter_col(attr_name) == attr_value).limit(1)
+        return db.execute(stmt).scalars().first()
 
     def get_multi(
             self,
@@ -84,13 +123,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             Results are ordered by model.id by default. Override in subclass
             for custom ordering.
         """
-        return (
-            db.query(self.model)
-            .order_by(self.model.id)
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+        stmt = select(self.model).order_by(self.model.id).offset(skip).limit(limit)
+        return db.execute(stmt).scalars().all()
 
     def get_multi_with_filter(
             self,
@@ -133,13 +167,113 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             # Get active projects with budget > handled by custom CRUD method
             # This method only supports equality (==) filters
         """
-        query = db.query(self.model)
+        stmt = select(self.model)
+
+        if filters:
+            for attr_name, attr_value in filters.items():
+                stmt = stmt.where(self._filter_col(attr_name) == attr_value)
+
+        stmt = stmt.order_by(self.model.id).offset(skip).limit(limit)
+        return db.execute(stmt).scalars().all()
+
+    def get_multi_with_count(
+            self,
+            db: Session,
+            *,
+            filters: Optional[Dict[str, Any]] = None,
+            skip: int = 0,
+            limit: int = 5000
+    ) -> Tuple[List[ModelType], int]:
+        """Get a page of records and the total matching count in one query.
+
+        Combines get_multi_with_filter() and count_with_filter() into a single
+        round-trip using a COUNT(*) OVER () window function, so paginated
+        endpoints don't issue two separate queries per request.
+
+        Args:
+            db: Database session for the query.
+            filters: Dictionary of attribute names and values to filter by.
+                Each filter applies an equality check (attr == value).
+                If None or empty, no filters are applied.
+            skip: Number of records to skip (offset). Defaults to 0.
+            limit: Maximum number of records to return. Defaults to 5000.
+
+        Returns:
+            Tuple of (items, total):
+            - items: List of model instances for the page, ordered by ID.
+            - total: Total number of records matching the filters.
+
+        Note:
+            If the requested page is past the end of the result set, a
+            fallback count query is issued so the total stays accurate.
+        """
+        stmt = select(self.model, func.count().over().label("_total"))
+
+        if filters:
+            for attr_name, attr_value in filters.items():
+                stmt = stmt.where(self._filter_col(attr_name) == attr_value)
+
+        stmt = stmt.order_by(self.model.id).offset(skip).limit(limit)
+        rows = db.execute(stmt).all()
+
+        if not rows:
+            # Page beyond the result set: window count is unavailable.
+            return [], self.count_with_filter(db, filters=filters)
+
+        return [row[0] for row in rows], rows[0]._total
+
+    def get_multi_keyset(
+            self,
+            db: Session,
+            *,
+            filters: Optional[Dict[str, Any]] = None,
+            after_id: Optional[Any] = None,
+            limit: int = 5000
+    ) -> Tuple[List[ModelType], Optional[Any]]:
+        """Get a page of records using keyset (seek) pagination.
+
+        Instead of OFFSET, pages are addressed by the ID of the last record
+        on the previous page (`WHERE id > after_id`). The database seeks
+        straight to the page via the primary key index, so latency stays
+        O(page size) regardless of how deep into the table the client is,
+        and no count query is needed.
+
+        Args:
+            db: Database session for the query.
+            filters: Dictionary of attribute names and values to filter by.
+                Each filter applies an equality check (attr == value).
+            after_id: ID of the last record on the previous page. If None,
+                the first page is returned.
+            limit: Maximum number of records to return. Defaults to 5000.
+
+        Returns:
+            Tuple of (items, next_cursor):
+            - items: List of model instances, ordered by ID ascending.
+            - next_cursor: ID to pass as after_id for the next page, or
+              None if this is the last page.
+
+        Note:
+            Fetches limit + 1 rows to detect whether a next page exists
+            without a separate count or existence query.
+        """
+        stmt = select(self.model)
 
         if filters:
             for attr_name, attr_value in filters.items():
-                query = query.filter(getattr(self.model, attr_name) == attr_value)
+                stmt = stmt.where(self._filter_col(attr_name) == attr_value)
+
+        if after_id is not None:
+            stmt = stmt.where(self.model.id > after_id)
+
+        stmt = stmt.order_by(self.model.id).limit(limit + 1)
+        items = db.execute(stmt).scalars().all()
 
-        return query.order_by(self.model.id).offset(skip).limit(limit).all()
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = items[-1].id
+
+        return items, next_cursor
 
     def count(self, db: Session) -> int:
         """Get total count of all records.
@@ -150,7 +284,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             Total number of records in the table.
         """
-        return db.query(self.model).count()
+        stmt = select(func.count()).select_from(self.model)
+        return db.execute(stmt).scalar_one()
 
     def count_with_filter(
             self,
@@ -176,14 +311,16 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Note:
             All filters must match (AND logic, not OR).
             Used for pagination metadata (calculating total pages).
+            Emits a direct SELECT COUNT(*) rather than the subquery-wrapped
+            form Query.count() generates, which is cheaper on wide tables.
         """
-        query = db.query(self.model)
+        stmt = select(func.count()).select_from(self.model)
 
         if filters:
             for attr_name, attr_value in filters.items():
-                query = query.filter(getattr(self.model, attr_name) == attr_value)
+                stmt = stmt.where(self._filter_col(attr_name) == attr_value)
 
-        return query.count()
+        return db.execute(stmt).scalar_one()
 
     def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
         """Create a new record in the database.
@@ -198,17 +335,215 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             (like ID, timestamps) populated.
 
         Note:
-            The obj_in schema is converted to a dict using jsonable_encoder
-            before creating the model instance. This handles Pydantic models,
-            enums, and other complex types correctly.
+            The obj_in schema is converted with model_dump(), which keeps
+            native UUID/datetime values that SQLAlchemy consumes directly
+            (jsonable_encoder would stringify them only for SQLAlchemy to
+            parse them back).
         """
-        obj_in_data = jsonable_encoder(obj_in)
+        obj_in_data = obj_in.model_dump()
         db_obj = self.model(**obj_in_data)  # type: ignore
         db.add(db_obj)
         db.commit()
         db.refresh(db_obj)
         return db_obj
 
+    def create_many(self, db: Session, *, objs_in: List[CreateSchemaType]) -> int:
+        """Insert many records in a single executemany statement.
+
+        Unlike looping create(), which issues one INSERT + commit per row,
+        this sends all rows through one insert() execution and a single
+        commit — the difference between seconds and minutes when the Excel
+        ingestion task loads thousands of rows.
+
+        Args:
+            db: Database session for the transaction.
+            objs_in: List of Pydantic schemas to insert.
+
+        Returns:
+            Number of rows inserted.
+
+        Note:
+            Inserted instances are not returned; callers that need the
+            generated IDs should query afterwards. Database defaults
+            (timestamps, UUIDs) are still applied per row.
+        """
+        if not objs_in:
+            return 0
+        payload = [obj.model_dump() for obj in objs_in]
+        db.execute(self._insert_stmt, payload)
+        db.commit()
+        return len(payload)
+
+    def _conflict_update_set(self, stmt) -> Dict[str, Any]:
+        """Build the ON CONFLICT SET mapping: every column except the
+        surrogate id, the business key itself, and created_at."""
+        return {
+            c.name: stmt.excluded[c.name]
+            for c in self.model.__table__.columns
+            if c.name not in ("id", self.business_key, "created_at")
+        }
+
+    def upsert(
+            self, db: Session, *, obj_in: CreateSchemaType
+    ) -> Tuple[ModelType, bool]:
+        """Insert or update a record keyed on the business key.
+
+        On PostgreSQL this is a single INSERT ... ON CONFLICT DO UPDATE
+        round trip; was_created is derived from the row's xmax system
+        column (0 for a fresh insert, non-zero when the conflict branch
+        updated an existing row). Other dialects fall back to the
+        SELECT-then-INSERT/UPDATE path.
+
+        This enables re-uploading the same file without creating duplicates.
+
+        Args:
+            db: Database session for the transaction.
+            obj_in: Data to insert or update.
+
+        Returns:
+            Tuple of (instance, was_created):
+            - instance: The created or updated model instance.
+            - was_created: True if newly inserted, False if updated.
+
+        Raises:
+            TypeError: If the CRUD class defines no business_key.
+        """
+        if self.business_key is None:
+            raise TypeError(f"{type(self).__name__} defines no business_key")
+
+        if db.get_bind().dialect.name != "postgresql":
+            return self._upsert_legacy(db, obj_in=obj_in)
+
+        stmt = pg_insert(self.model).values(**obj_in.model_dump())
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[self.business_key],
+            set_=self._conflict_update_set(stmt),
+        ).returning(
+            self.model, literal_column("(xmax = 0)").label("was_created")
+        )
+
+        row = db.execute(
+            stmt, execution_options={"populate_existing": True}
+        ).one()
+        db.commit()
+        return row[0], row.was_created
+
+    def upsert_many(
+            self,
+            db: Session,
+            *,
+            objs_in: List[CreateSchemaType],
+            batch_size: int = BULK_BATCH_SIZE
+    ) -> int:
+        """Insert or update many records keyed on the business key.
+
+        Batched variant of upsert() for the Excel ingestion path: each batch
+        is one INSERT ... ON CONFLICT DO UPDATE round trip instead of N
+        SELECT+write pairs, which is where bulk re-uploads spend their time.
+
+        Args:
+            db: Database session for the transaction.
+            objs_in: Schemas to insert or update.
+            batch_size: Rows per statement. Defaults to BULK_BATCH_SIZE,
+                matching the engine's insertmanyvalues_page_size.
+
+        Returns:
+            Number of rows written.
+
+        Raises:
+            TypeError: If the CRUD class defines no business_key.
+
+        Note:
+            All batches commit in one transaction; on constraint errors the
+            caller should roll back and fall back to per-row upsert() to
+            isolate the offending rows.
+        """
+        if self.business_key is None:
+            raise TypeError(f"{type(self).__name__} defines no business_key")
+
+        if not objs_in:
+            return 0
+
+        if (
+            len(objs_in) >= COPY_MIN_ROWS
+            and db.get_bind().dialect.name == "postgresql"
+        ):
+            # Very large loads: COPY into a staging table and merge once,
+            # instead of thousands of batched INSERT statements.
+            total = copy_upsert(
+                db,
+                model=self.model,
+                business_key=self.business_key,
+                rows=[obj.model_dump() for obj in objs_in],
+            )
+            db.commit()
+            return total
+
+        total = 0
+        it = iter(objs_in)
+        while chunk := list(itertools.islice(it, batch_size)):
+            rows = [obj.model_dump() for obj in chunk]
+            stmt = pg_insert(self.model).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[self.business_key],
+                set_=self._conflict_update_set(stmt),
+            )
+            db.execute(stmt)
+            total += len(rows)
+
+        db.commit()
+        return total
+
+    def upsert_df(self, db: Session, *, df) -> int:
+        """Upsert a transformed DataFrame via the COPY staging path.
+
+        Columnar variant of upsert_many() for sheets that stayed in
+        DataFrame form through validation and transformation: the frame
+        streams straight into copy_upsert_df() without materializing
+        per-row dicts or schemas. Only for trusted pipeline output —
+        values bypass Pydantic entirely.
+
+        Args:
+            db: Database session for the transaction.
+            df: Transformed rows with columns named after table columns.
+
+        Returns:
+            Number of rows written.
+
+        Raises:
+            TypeError: If the CRUD class defines no business_key.
+            NotImplementedError: On non-PostgreSQL dialects; callers fall
+                back to the schema-based path.
+        """
+        if self.business_key is None:
+            raise TypeError(f"{type(self).__name__} defines no business_key")
+
+        if db.get_bind().dialect.name != "postgresql":
+            raise NotImplementedError("upsert_df requires PostgreSQL COPY")
+
+        total = copy_upsert_df(
+            db,
+            model=self.model,
+            business_key=self.business_key,
+            df=df,
+        )
+        db.commit()
+        return total
+
+    def _upsert_legacy(
+            self, db: Session, *, obj_in: CreateSchemaType
+    ) -> Tuple[ModelType, bool]:
+        """SELECT-then-write upsert for non-PostgreSQL dialects."""
+        key_value = getattr(obj_in, self.business_key)
+        existing = self.get_by_attribute(db, self.business_key, key_value)
+
+        if existing:
+            updated = self.update(db, db_obj=existing, obj_in=obj_in)
+            return updated, False
+        else:
+            created = self.create(db, obj_in=obj_in)
+            return created, True
+
     def update(
             self,
             db: Session,
@@ -227,28 +562,24 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 Only fields with values will be updated (exclude_unset=True).
 
         Returns:
-            Updated model instance with refreshed data from database.
+            Updated model instance. No refresh SELECT is issued: updated_at
+            is a client-side onupdate, so every written value is already on
+            the object after the flush.
 
         Note:
             Partial updates are supported - only provide fields you want to change.
             The exclude_unset=True parameter ensures unset fields are not updated
             to None.
         """
-        obj_data = jsonable_encoder(db_obj)
         if isinstance(obj_in, dict):
             update_data = obj_in
         else:
-            if hasattr(obj_in, "model_dump"):
-                update_data = obj_in.model_dump(exclude_unset=True)
-            else:
-                update_data = obj_in.dict(exclude_unset=True)
-
-        for field in obj_data:
-            if field in update_data:
-                setattr(db_obj, field, update_data[field])
+            update_data = obj_in.model_dump(exclude_unset=True)
+
+        for field, value in update_data.items():
+            setattr(db_obj, field, value)
         db.add(db_obj)
         db.commit()
-        db.refresh(db_obj)
         return db_obj
 
     def remove(self, db: Session, *, id_value: int) -> ModelType:
@@ -261,7 +592,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             The deleted model instance, or None if not found.
         """
-        obj = db.query(self.model).get(id_value)
+        obj = db.get(self.model, id_value)
         if obj:
             db.delete(obj)
             db.commit()
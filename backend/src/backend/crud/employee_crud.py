@@ -1,8 +1,5 @@
 """CRUD operations for Employee model."""
 
-from typing import Tuple
-from sqlalchemy.orm import Session
-
 from backend.crud.base import CRUDBase
 from backend.models.employee import Employee
 from backend.schemas.employee import EmployeeCreate, EmployeeUpdate
@@ -21,41 +18,14 @@ class CRUDEmployee(CRUDBase[Employee, EmployeeCreate, EmployeeUpdate]):
     - create(db, obj_in) - Create new employee
     - update(db, db_obj, obj_in) - Update existing employee
     - remove(db, id_value) - Delete employee
-
-    Custom methods:
     - upsert(db, obj_in) - Insert or update based on employee_id
-    """
-
-    def upsert(self, db: Session, *, obj_in: EmployeeCreate) -> Tuple[Employee, bool]:
-        """Insert or update employee based on employee_id (business key).
-
-        Checks if employee with this employee_id already exists:
-        - If exists → UPDATE with new data
-        - If not exists → INSERT new record
+    - upsert_many(db, objs_in) - Batched insert-or-update for ingestion
 
-        This enables re-uploading the same file without creating duplicates.
-
-        Args:
-            db: Database session for the transaction.
-            obj_in: Employee data to insert or update.
-
-        Returns:
-            Tuple of (employee_instance, was_created)
-            - employee_instance: The created or updated Employee model
-            - was_created: True if newly inserted, False if updated
-
-        Note:
-            Uses get_by_attribute() from base class to check for existing record.
-            Uses update() and create() from base class for the actual operations.
-        """
-        existing = self.get_by_attribute(db, "employee_id", obj_in.employee_id)
+    The upsert helpers key on employee_id (the business key from Excel),
+    so re-uploading the same file updates rows instead of duplicating them.
+    """
 
-        if existing:
-            updated = self.update(db, db_obj=existing, obj_in=obj_in)
-            return updated, False
-        else:
-            created = self.create(db, obj_in=obj_in)
-            return created, True
+    business_key = "employee_id"
 
 
 employee_crud = CRUDEmployee(Employee)
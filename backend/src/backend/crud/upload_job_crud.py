@@ -1,12 +1,95 @@
 """CRUD operations for UploadJob model."""
 
-from typing import List, Optional
+import base64
+import functools
+import uuid
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import bindparam, func, select, text, tuple_
 from sqlalchemy.orm import Session
 
 from backend.crud.base import CRUDBase
 from backend.models.upload_job import UploadJob
 from backend.schemas.upload_job import UploadJobCreate, UploadJobUpdate
 
+#: Delta update for progress ticks; a plain textual statement because the
+#: ORM unit of work (load, mutate, flush, refresh) is all overhead for a
+#: fire-and-forget counter increment.
+_PROGRESS_UPDATE = text(
+    "UPDATE upload_job "
+    "SET processed_rows = COALESCE(processed_rows, 0) + :delta "
+    "WHERE id = :job_id"
+)
+
+
+class ProgressAggregator:
+    """Batches processed_rows increments into periodic delta UPDATEs.
+
+    Ticking the job counter once per persisted row costs one UPDATE round
+    trip per row — for large files that dwarfs the insert work itself.
+    This accumulates ticks in Python and flushes a single additive UPDATE
+    every flush_every rows, so the status endpoint still sees progress
+    move while the database sees N/flush_every statements instead of N.
+
+    Usage:
+        progress = ProgressAggregator(db, job_id, flush_every=1000)
+        for row in rows:
+            persist(row)
+            progress.tick()
+        progress.flush()  # final partial batch
+    """
+
+    def __init__(self, db: Session, job_id: str, *, flush_every: int = 1000):
+        """Initialize the aggregator.
+
+        Args:
+            db: Database session used for the delta UPDATEs.
+            job_id: Upload job UUID (string form is fine).
+            flush_every: Number of ticks to accumulate before flushing.
+        """
+        self.db = db
+        self.job_id = job_id
+        self.flush_every = flush_every
+        self._pending = 0
+
+    def tick(self, n: int = 1) -> None:
+        """Record n processed rows, flushing once the threshold is reached."""
+        self._pending += n
+        if self._pending >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write any accumulated delta to the database and commit."""
+        if self._pending == 0:
+            return
+        self.db.execute(
+            _PROGRESS_UPDATE,
+            {"delta": self._pending, "job_id": self.job_id}
+        )
+        self.db.commit()
+        self._pending = 0
+
+
+@functools.lru_cache(maxsize=32)
+def _jobs_ordered_stmt(filter_keys: Tuple[str, ...]):
+    """Build (and memoize) the ordered jobs statement for a filter-key set.
+
+    The filter vocabulary is tiny (effectively just "status"), so caching
+    the constructed statement per key combination skips re-building the
+    select/where/order_by chain on every listing call; values are supplied
+    as bound parameters at execution time.
+    """
+    stmt = select(UploadJob)
+    for key in filter_keys:
+        stmt = stmt.where(getattr(UploadJob, key) == bindparam(f"f_{key}"))
+    return (
+        stmt
+        .order_by(UploadJob.created_at.desc(), UploadJob.id.desc())
+        .offset(bindparam("off"))
+        .limit(bindparam("lim"))
+    )
+
 
 class CRUDUploadJob(CRUDBase[UploadJob, UploadJobCreate, UploadJobUpdate]):
     """CRUD operations for UploadJob model.
@@ -24,10 +107,22 @@ class CRUDUploadJob(CRUDBase[UploadJob, UploadJobCreate, UploadJobUpdate]):
 
     Custom methods:
     - get_jobs_ordered(db, filters, skip, limit) - Get jobs with custom ordering (created_at DESC)
+    - get_jobs_keyset(db, filters, cursor, limit) - Cursor-paginated job listing
+    - list_jobs(db, filters, skip, limit) - Read-only listing without ORM objects
 
     Note: UploadJob doesn't need upsert() because each upload creates a unique job.
     """
 
+    #: Columns the list endpoint's response schema needs, resolved once.
+    _list_columns = tuple(
+        getattr(UploadJob, name) for name in (
+            "id", "filename", "file_path", "status", "current_step",
+            "total_rows", "processed_rows", "error_rows", "error_details",
+            "error_message", "started_at", "completed_at",
+            "created_at", "updated_at",
+        )
+    )
+
     def get_jobs_ordered(
             self,
             db: Session,
@@ -81,19 +176,191 @@ class CRUDUploadJob(CRUDBase[UploadJob, UploadJobCreate, UploadJobUpdate]):
 
             But for job listings, we want newest-first ordering, so this method exists.
         """
-        query = db.query(self.model)
+        filters = filters or {}
+        # Validate keys up front so unknown filters still fail loudly
+        for attr_name in filters:
+            self._filter_col(attr_name)
+
+        stmt = _jobs_ordered_stmt(tuple(sorted(filters)))
+        params = {f"f_{key}": value for key, value in filters.items()}
+        params["off"] = skip
+        params["lim"] = limit
+        return db.execute(stmt, params).scalars().all()
+
+    def get_jobs_ordered_with_count(
+            self,
+            db: Session,
+            *,
+            filters: Optional[dict] = None,
+            skip: int = 0,
+            limit: int = 20
+    ) -> Tuple[List[UploadJob], int]:
+        """Get a page of jobs (newest first) and the total count in one query.
+
+        Window-function variant of get_jobs_ordered() that also returns the
+        total matching count via COUNT(*) OVER (), saving the separate
+        count_with_filter() round-trip on the jobs list endpoint.
+
+        Args:
+            db: Database session for the query.
+            filters: Optional dictionary of filters (e.g., {"status": "pending"}).
+            skip: Number of records to skip (offset). Defaults to 0.
+            limit: Maximum number of records to return. Defaults to 20.
+
+        Returns:
+            Tuple of (jobs, total):
+            - jobs: List of UploadJob instances ordered by created_at DESC.
+            - total: Total number of jobs matching the filters.
+        """
+        stmt = select(self.model, func.count().over().label("_total"))
 
         if filters:
             for attr_name, attr_value in filters.items():
-                query = query.filter(getattr(self.model, attr_name) == attr_value)
+                stmt = stmt.where(self._filter_col(attr_name) == attr_value)
 
-        return (
-            query
-            .order_by(self.model.created_at.desc())
+        stmt = (
+            stmt
+            .order_by(self.model.created_at.desc(), self.model.id.desc())
             .offset(skip)
             .limit(limit)
-            .all()
         )
+        rows = db.execute(stmt).all()
+
+        if not rows:
+            return [], self.count_with_filter(db, filters=filters)
+
+        return [row[0] for row in rows], rows[0]._total
+
+    @staticmethod
+    def encode_cursor(created_at: datetime, id_value: uuid.UUID) -> str:
+        """Encode a job's (created_at, id) position as an opaque cursor."""
+        raw = f"{created_at.isoformat()}|{id_value}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+        """Decode an opaque cursor back to (created_at, id).
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+            created_at_str, id_str = raw.split("|", 1)
+            return datetime.fromisoformat(created_at_str), uuid.UUID(id_str)
+        except Exception:
+            raise ValueError(f"Invalid cursor: {cursor}")
+
+    def get_jobs_keyset(
+            self,
+            db: Session,
+            *,
+            filters: Optional[dict] = None,
+            cursor: Optional[str] = None,
+            limit: int = 20
+    ) -> Tuple[List[UploadJob], Optional[str]]:
+        """Get a page of jobs (newest first) using keyset pagination.
+
+        Instead of OFFSET — which scans and discards skipped rows, getting
+        slower the deeper the page — the cursor pins the position of the
+        last row seen and the query seeks `(created_at, id) < cursor`
+        directly via the (created_at, id) composite index. Page cost stays
+        constant no matter how large upload_job grows, and no count query
+        is issued.
+
+        Args:
+            db: Database session for the query.
+            filters: Optional dictionary of filters (e.g., {"status": "pending"}).
+            cursor: Opaque cursor from a previous page's next_cursor, or
+                None for the first page.
+            limit: Maximum number of records to return. Defaults to 20.
+
+        Returns:
+            Tuple of (jobs, next_cursor):
+            - jobs: List of UploadJob instances ordered by created_at DESC,
+              id DESC (the id tie-break keeps paging deterministic when
+              jobs share a timestamp).
+            - next_cursor: Cursor for the next page, or None on the last
+              page.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        stmt = select(self.model)
+
+        if filters:
+            for attr_name, attr_value in filters.items():
+                stmt = stmt.where(self._filter_col(attr_name) == attr_value)
+
+        if cursor is not None:
+            after_created_at, after_id = self.decode_cursor(cursor)
+            stmt = stmt.where(
+                tuple_(self.model.created_at, self.model.id)
+                < tuple_(after_created_at, after_id)
+            )
+
+        stmt = (
+            stmt
+            .order_by(self.model.created_at.desc(), self.model.id.desc())
+            .limit(limit + 1)
+        )
+        jobs = db.execute(stmt).scalars().all()
+
+        next_cursor = None
+        if len(jobs) > limit:
+            jobs = jobs[:limit]
+            last = jobs[-1]
+            next_cursor = self.encode_cursor(last.created_at, last.id)
+
+        return jobs, next_cursor
+
+
+    def list_jobs(
+            self,
+            db: Session,
+            *,
+            filters: Optional[dict] = None,
+            skip: int = 0,
+            limit: int = 20
+    ) -> Tuple[List[dict], int]:
+        """Read-only jobs listing that skips ORM object materialization.
+
+        The jobs list endpoint only serializes rows back out; building full
+        UploadJob instances (identity map, state tracking) per row is pure
+        overhead there. This selects the columns the API schema needs and
+        returns plain row mappings, with the total via COUNT(*) OVER ()
+        like get_jobs_ordered_with_count().
+
+        Args:
+            db: Database session for the query.
+            filters: Optional dictionary of filters (e.g., {"status": "pending"}).
+            skip: Number of records to skip (offset). Defaults to 0.
+            limit: Maximum number of records to return. Defaults to 20.
+
+        Returns:
+            Tuple of (rows, total):
+            - rows: List of dict-like row mappings ordered by created_at
+              DESC, id DESC, ready for schema validation.
+            - total: Total number of jobs matching the filters.
+        """
+        stmt = select(*self._list_columns, func.count().over().label("_total"))
+
+        if filters:
+            for attr_name, attr_value in filters.items():
+                stmt = stmt.where(self._filter_col(attr_name) == attr_value)
+
+        stmt = (
+            stmt
+            .order_by(self.model.created_at.desc(), self.model.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        rows = db.execute(stmt).mappings().all()
+
+        if not rows:
+            return [], self.count_with_filter(db, filters=filters)
+
+        return rows, rows[0]["_total"]
 
 
 upload_job_crud = CRUDUploadJob(UploadJob)
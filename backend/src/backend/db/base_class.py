@@ -2,6 +2,12 @@ import typing as t
 import re
 from sqlalchemy.orm import DeclarativeBase, declared_attr
 
+#: Precompiled CamelCase boundary pattern; __tablename__ runs for every
+#: model class (and again for subclasses), so compile/parse it once.
+_CAMEL_RE = re.compile('((?<=[a-z0-9])[A-Z]|(?!^)[A-Z](?=[a-z]))')
+
+_TABLENAME_CACHE: t.Dict[str, str] = {}
+
 
 class Base(DeclarativeBase):
     """SQLAlchemy declarative base with automatic table name generation.
@@ -28,5 +34,7 @@ class Base(DeclarativeBase):
     @declared_attr.directive
     def __tablename__(cls) -> str:
         """Generate table name from class name using snake_case convention."""
-        name = re.sub('((?<=[a-z0-9])[A-Z]|(?!^)[A-Z](?=[a-z]))', r'_\1', cls.__name__)
-        return name.lower()
+        return _TABLENAME_CACHE.setdefault(
+            cls.__name__,
+            _CAMEL_RE.sub(r'_\1', cls.__name__).lower()
+        )
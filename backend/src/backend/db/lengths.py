@@ -1,3 +1,6 @@
+import sys
+
+
 class L:
     """
     Field length constants.
@@ -49,6 +52,55 @@ class L:
     IP_ADDRESS = 45         # IPv6 max length (8 groups of 4 hex digits + 7 colons)
 
 
+#: Reference table sections for print_lengths(), built once at import as an
+#: immutable structure instead of per call.
+_SECTIONS = (
+    ("Names & Identity", (
+        ("NAME_SHORT", "username, handle, display_name"),
+        ("NAME_STANDARD", "first_name, last_name, middle_name"),
+        ("NAME_FULL", "full_name (first + middle + last)"),
+        ("EMAIL", "RFC 5321 max email length"),
+        ("PHONE", "International format"),
+    )),
+    ("Text Content", (
+        ("TITLE", "Titles, headings, dictionary names"),
+        ("SUBTITLE", "Descriptions, summaries"),
+        ("Text type", "Use for unlimited content (import from sqlalchemy)"),
+    )),
+    ("URLs & Paths", (
+        ("URL", "Max browser URL length"),
+        ("SLUG", "URL-friendly identifiers"),
+        ("DOMAIN", "Max DNS domain length"),
+        ("PATH", "File paths, URI paths"),
+    )),
+    ("Security & Tokens", (
+        ("HASH", "SHA256 hash"),
+        ("HASH_BCRYPT", "Bcrypt output"),
+        ("PASSWORD", "User password (before hashing)"),
+        ("TOKEN", "OAuth tokens, API keys"),
+        ("TOKEN_LONG", "JWT with many claims"),
+        ("UUID_STR", "UUID with hyphens"),
+    )),
+    ("OAuth2 & Auth", (
+        ("CLIENT_ID", "OAuth2 client_id"),
+        ("CLIENT_SECRET", "OAuth2 client_secret (hashed)"),
+        ("SCOPE", "Space-separated scopes"),
+        ("GRANT_TYPE", "OAuth grant type"),
+    )),
+    ("Codes & Identifiers", (
+        ("CODE", "General codes (status, type)"),
+        ("REFERENCE", "Reference numbers, IDs"),
+        ("LANGUAGE", "Language code (en-US)"),
+        ("COUNTRY", "Country code (US)"),
+        ("CURRENCY", "Currency code (USD)"),
+    )),
+    ("Request Metadata", (
+        ("USER_AGENT", "Browser/client user agent"),
+        ("IP_ADDRESS", "IPv6 max length"),
+    )),
+)
+
+
 def print_lengths():
     """Print formatted table of all field length constants for reference.
 
@@ -73,74 +125,32 @@ def print_lengths():
         This function is primarily for development reference and debugging.
         The constants should be used directly in code via the L class.
     """
-    print("\n" + "=" * 80)
-    print(" DATABASE FIELD LENGTH STANDARDS".center(80))
-    print("=" * 80 + "\n")
-
-    sections = {
-        "Names & Identity": [
-            ("NAME_SHORT", "username, handle, display_name"),
-            ("NAME_STANDARD", "first_name, last_name, middle_name"),
-            ("NAME_FULL", "full_name (first + middle + last)"),
-            ("EMAIL", "RFC 5321 max email length"),
-            ("PHONE", "International format"),
-        ],
-        "Text Content": [
-            ("TITLE", "Titles, headings, dictionary names"),
-            ("SUBTITLE", "Descriptions, summaries"),
-            ("Text type", "Use for unlimited content (import from sqlalchemy)"),
-        ],
-        "URLs & Paths": [
-            ("URL", "Max browser URL length"),
-            ("SLUG", "URL-friendly identifiers"),
-            ("DOMAIN", "Max DNS domain length"),
-            ("PATH", "File paths, URI paths"),
-        ],
-        "Security & Tokens": [
-            ("HASH", "SHA256 hash"),
-            ("HASH_BCRYPT", "Bcrypt output"),
-            ("PASSWORD", "User password (before hashing)"),
-            ("TOKEN", "OAuth tokens, API keys"),
-            ("TOKEN_LONG", "JWT with many claims"),
-            ("UUID_STR", "UUID with hyphens"),
-        ],
-        "OAuth2 & Auth": [
-            ("CLIENT_ID", "OAuth2 client_id"),
-            ("CLIENT_SECRET", "OAuth2 client_secret (hashed)"),
-            ("SCOPE", "Space-separated scopes"),
-            ("GRANT_TYPE", "OAuth grant type"),
-        ],
-        "Codes & Identifiers": [
-            ("CODE", "General codes (status, type)"),
-            ("REFERENCE", "Reference numbers, IDs"),
-            ("LANGUAGE", "Language code (en-US)"),
-            ("COUNTRY", "Country code (US)"),
-            ("CURRENCY", "Currency code (USD)"),
-        ],
-        "Request Metadata": [
-            ("USER_AGENT", "Browser/client user agent"),
-            ("IP_ADDRESS", "IPv6 max length"),
-        ],
-    }
-
-    for section_name, fields in sections.items():
-        print(f"\n{section_name}:")
+    lines = []
+    lines.append("\n" + "=" * 80)
+    lines.append(" DATABASE FIELD LENGTH STANDARDS".center(80))
+    lines.append("=" * 80 + "\n")
+
+    for section_name, fields in _SECTIONS:
+        lines.append(f"\n{section_name}:")
         for field_name, description in fields:
             if field_name == "Text type":
-                print(f"  {'Text':<20} {'∞':>6}   {description}")
+                lines.append(f"  {'Text':<20} {'∞':>6}   {description}")
             else:
                 value = getattr(L, field_name, "N/A")
-                print(f"  L.{field_name:<18} {str(value):>6}   {description}")
-
-    print("\n" + "=" * 80)
-    print("\nUsage:")
-    print("  from backend.db.lengths import L")
-    print("  from sqlalchemy import String, Text")
-    print("  ")
-    print("  name: Mapped[str] = mapped_column(String(L.NAME_STANDARD))")
-    print("  description: Mapped[str] = mapped_column(Text)")
-    print("  ")
-    print("=" * 80 + "\n")
+                lines.append(f"  L.{field_name:<18} {str(value):>6}   {description}")
+
+    lines.append("\n" + "=" * 80)
+    lines.append("\nUsage:")
+    lines.append("  from backend.db.lengths import L")
+    lines.append("  from sqlalchemy import String, Text")
+    lines.append("  ")
+    lines.append("  name: Mapped[str] = mapped_column(String(L.NAME_STANDARD))")
+    lines.append("  description: Mapped[str] = mapped_column(Text)")
+    lines.append("  ")
+    lines.append("=" * 80 + "\n")
+
+    # One write instead of 30+ print() calls (each takes the stdout lock)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
@@ -1,21 +1,46 @@
 from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from backend.core.config import settings
 
+#: Rows per batched INSERT/upsert statement. 1000 is the PostgreSQL sweet
+#: spot — larger batches buy almost nothing while growing memory and lock
+#: hold times. Shared between the engine's insertmanyvalues rewriting and
+#: the CRUD bulk helpers so the two can't drift apart.
+BULK_BATCH_SIZE = 1000
+
 #: SQLAlchemy engine for PostgreSQL database.
 #:
-#: Configuration:
+#: Configuration (tunable via DB_* settings so API and Celery workers can
+#: be sized independently without code changes):
 #: - pool_pre_ping: Test connections before use (detect stale connections)
-#: - pool_size: 10 connections maintained in pool
-#: - max_overflow: 20 additional connections when pool exhausted
+#: - pool_size: connections maintained in pool (default 20)
+#: - max_overflow: additional connections when pool exhausted (default 40)
 #:
-#: Total max connections: pool_size + max_overflow = 30
+#: Total max connections: DB_POOL_SIZE + DB_MAX_OVERFLOW
 engine = create_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    # Bound checkout waits instead of queueing forever under burst load
+    pool_timeout=30,
+    # Recycle connections before typical idle-kill windows (proxies, pgbouncer)
+    pool_recycle=1800,
+    # LIFO keeps a small set of connections hot instead of round-robining
+    # the whole pool through TLS/libpq handshakes
+    pool_use_lifo=True,
+    # Server-side guard: no statement may run longer than 30s
+    connect_args={"options": "-c statement_timeout=30000"},
+    # Page size for SQLAlchemy's batched INSERT rewriting; aligned with the
+    # batch_size used by the bulk upsert helpers.
+    insertmanyvalues_page_size=BULK_BATCH_SIZE,
+    # Compiled-statement cache sized to hold every hot statement shape (CRUD
+    # selects, batched inserts, upserts) so repeated ingestion batches skip
+    # the compile pipeline entirely. Default is 500; pinned explicitly so a
+    # future default change can't silently reintroduce recompiles.
+    query_cache_size=500
 )
 
 #: Session factory for creating database sessions.
@@ -23,8 +48,31 @@ engine = create_engine(
 #: Configuration:
 #: - autocommit=False: Requires explicit db.commit()
 #: - autoflush=False: Manual control over when changes flushed to DB
+#: - expire_on_commit=False: ORM objects stay readable after commit without
+#:   implicit refresh round trips (timestamps use client-side onupdate, so
+#:   nothing server-generated needs re-reading on UPDATE)
 #: - bind=engine: Sessions use the configured engine
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
+
+#: Async engine on psycopg's asyncio support (same driver, async connection
+#: class). Endpoints that await DB I/O stop blocking the event loop on
+#: libpq sockets; the sync engine stays for Alembic and the Celery worker.
+async_engine = create_async_engine(
+    settings.DATABASE_URL,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=30,
+    pool_recycle=1800,
+    insertmanyvalues_page_size=BULK_BATCH_SIZE,
+    query_cache_size=500
+)
+
+#: Async session factory; expire_on_commit=False so returned ORM objects
+#: stay readable after commit without implicit refresh round trips.
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
 
 
 def get_db():
@@ -58,14 +106,38 @@ def get_db():
         db.close()
 
 
-def test_connection():
-    """Test database connectivity with simple query.
+async def get_async_db():
+    """FastAPI dependency providing an AsyncSession with cleanup.
+
+    Async counterpart of get_db() for endpoints being migrated to
+    non-blocking DB access. Same transactional conventions: explicit
+    commit, close in finally.
+
+    Yields:
+        AsyncSession: SQLAlchemy async session for database operations.
+    """
+    db = AsyncSessionLocal()
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
+def test_connection(deep: bool = False):
+    """Test database connectivity.
+
+    With pool_pre_ping enabled, a bare checkout already validates the
+    underlying socket, so the default shallow check is a checkout/close with
+    no query — one round trip cheaper. Pass deep=True to also execute
+    "SELECT 1", verifying the database can actually serve queries; the
+    application entrypoint uses this on startup.
 
-    Executes "SELECT 1" to verify database is accessible and responsive.
-    Used by application entrypoint to ensure database available before startup.
+    Args:
+        deep: Execute a "SELECT 1" round trip in addition to the checkout.
 
     Raises:
         SQLAlchemyError: If database connection fails or query execution fails.
     """
     with engine.connect() as conn:
-        conn.execute(text("SELECT 1"))
+        if deep:
+            conn.execute(text("SELECT 1"))
@@ -1,13 +1,16 @@
+import asyncio
 import logging
+import time
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from typing import Dict, Any
 
 from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from sqlalchemy.exc import SQLAlchemyError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from backend.api.api_v1.api import api_router
@@ -21,10 +24,23 @@ from backend.schemas.common import (
     ValidationErrorItem
 )
 from backend.db.session import test_connection
+import backend.models  # noqa: F401  (registers mappers at import)
+from sqlalchemy.orm import configure_mappers
+
+#: Error codes for the handful of statuses that dominate error traffic,
+#: resolved once at import so hot 4xx paths skip the lookup helper.
+_COMMON_ERROR_CODES = {
+    code: get_error_code(code) for code in (400, 401, 403, 404, 409, 422, 500)
+}
+
+#: App mode frozen at import; avoids property resolution on every error
+#: response and route setup check.
+IS_DEV = settings.is_development
+IS_PROD = settings.is_production
 
 # Configure logging
 logging.basicConfig(
-    level=logging.INFO if settings.is_development else logging.WARNING,
+    level=logging.INFO if IS_DEV else logging.WARNING,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
@@ -32,6 +48,26 @@ logger = logging.getLogger(__name__)
 # Suppress passlib bcrypt warnings (noisy in logs)
 logging.getLogger('passlib').setLevel(logging.ERROR)
 
+#: Cached DB health served by the `/` health check. Load balancers ping that
+#: endpoint far more often than DB status can usefully change; probing in
+#: the background means LB pings never check out a pool connection.
+_db_health: Dict[str, Any] = {"database_status": "unknown", "checked_at": None}
+
+_DB_HEALTH_PROBE_INTERVAL = 5.0  # seconds
+
+
+async def _probe_db_health() -> None:
+    """Background loop refreshing the cached DB health every few seconds."""
+    while True:
+        try:
+            await asyncio.to_thread(test_connection)
+            _db_health["database_status"] = "connected"
+        except Exception as e:
+            logger.error(f"Database health probe failed: {e}")
+            _db_health["database_status"] = "disconnected"
+        _db_health["checked_at"] = datetime.now(timezone.utc).isoformat()
+        await asyncio.sleep(_DB_HEALTH_PROBE_INTERVAL)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -61,19 +97,27 @@ async def lifespan(app: FastAPI):
     logger.info(f"Starting DataRails Demo API in {settings.APP_MODE} mode")
     logger.info(f"Database URL configured for host: {settings.DB_HOST}")
 
+    # Idempotent; guarantees mapper compilation is done before traffic even
+    # if a code path registered late mappers after the models import.
+    configure_mappers()
+
     # Test database connection
     try:
-        test_connection()
+        test_connection(deep=True)
         logger.info("Database connection successful")
     except Exception as e:
         logger.error(f"Database connection failed: {e}")
 
+    # Keep the health-check cache warm without per-request DB probes
+    health_probe = asyncio.create_task(_probe_db_health())
+
     logger.info("Application startup complete")
 
     yield
 
     # Shutdown
     logger.info("Shutting down DataRails Demo API")
+    health_probe.cancel()
     logger.info("Application shutdown complete")
 
 
@@ -103,18 +147,22 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     """
     logger.warning(f"HTTP {exc.status_code} on {request.url}: {exc.detail}")
 
-    # Create wrapped error response
-    error_response = BaseErrorResponse(
-        success=False,
-        error=ErrorDetail(
-            detail=str(exc.detail),
-            error_code=get_error_code(exc.status_code)
-        )
-    )
+    # Emit the wrapped shape directly; this handler fires for every 404 on
+    # stray paths, and building a Pydantic model just to model_dump() it
+    # is pure allocation on that path.
+    error_code = _COMMON_ERROR_CODES.get(exc.status_code)
+    if error_code is None:
+        error_code = get_error_code(exc.status_code)
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
-        content=error_response.model_dump(),
+        content={
+            "success": False,
+            "error": {
+                "detail": str(exc.detail),
+                "error_code": error_code
+            }
+        },
         headers=getattr(exc, 'headers', None)
     )
 
@@ -148,30 +196,31 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     Side Effects:
         Logs error with URL and validation error details.
     """
-    logger.error(f"Validation error on {request.url}: {exc.errors()}")
-
-    validation_errors = []
-    for error in exc.errors():
-        validation_errors.append(
-            ValidationErrorItem(
-                loc=list(error.get("loc", [])),
-                msg=error.get("msg", ""),
-                type=error.get("type", "")
-            )
-        )
-
-    # Create wrapped error response
-    error_response = BaseErrorResponse(
-        success=False,
-        error=ValidationErrorDetail(
-            detail=validation_errors,
-            error_code="VALIDATION_ERROR"
-        )
-    )
+    errors = exc.errors()
+    logger.error(f"Validation error on {request.url}: {errors}")
+
+    # Build the payload directly: the error shape mirrors
+    # BaseErrorResponse[ValidationErrorDetail], and round-tripping through
+    # Pydantic models on an error path validates nothing we don't already
+    # know while tripling the allocations.
+    validation_errors = [
+        {
+            "loc": list(error.get("loc", [])),
+            "msg": error.get("msg", ""),
+            "type": error.get("type", "")
+        }
+        for error in errors
+    ]
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
-        content=error_response.model_dump()
+        content={
+            "success": False,
+            "error": {
+                "detail": validation_errors,
+                "error_code": "VALIDATION_ERROR"
+            }
+        }
     )
 
 
@@ -202,7 +251,7 @@ async def general_exception_handler(request: Request, exc: Exception):
     logger.error(f"Unexpected error on {request.url}: {exc}", exc_info=True)
 
     # Create wrapped error response
-    error_message = str(exc) if settings.is_development else "Internal server error"
+    error_message = str(exc) if IS_DEV else "Internal server error"
     error_response = BaseErrorResponse(
         success=False,
         error=ErrorDetail(
@@ -211,9 +260,43 @@ async def general_exception_handler(request: Request, exc: Exception):
         )
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
+        status_code=500,
+        content=error_response.model_dump(mode="json")
+    )
+
+
+async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError):
+    """Handle SQLAlchemy errors with wrapped 500 response.
+
+    Registered on SQLAlchemyError directly so database failures dispatch in
+    one handler lookup instead of falling through to the wildcard Exception
+    walk, and so they get a DATABASE_ERROR code monitoring can alert on.
+
+    Args:
+        request: FastAPI request object.
+        exc: SQLAlchemy exception (connection loss, constraint violation...).
+
+    Returns:
+        JSONResponse with 500 status and wrapped error.
+
+    Side Effects:
+        Logs error with URL, exception, and full traceback.
+    """
+    logger.error(f"Database error on {request.url}: {exc}", exc_info=True)
+
+    error_message = str(exc) if IS_DEV else "Database error"
+    error_response = BaseErrorResponse(
+        success=False,
+        error=ErrorDetail(
+            detail=error_message,
+            error_code="DATABASE_ERROR"
+        )
+    )
+
+    return ORJSONResponse(
         status_code=500,
-        content=error_response.model_dump()
+        content=error_response.model_dump(mode="json")
     )
 
 
@@ -226,20 +309,29 @@ app = FastAPI(
     # Security: Disable API documentation in production
     # - Development: /docs and /redoc available for interactive API testing
     # - Production: Routes return 404 (not registered at all)
-    docs_url=f"{settings.API_PATH}/docs" if settings.is_development else None,
-    redoc_url=f"{settings.API_PATH}/redoc" if settings.is_development else None,
+    docs_url=f"{settings.API_PATH}/docs" if IS_DEV else None,
+    redoc_url=f"{settings.API_PATH}/redoc" if IS_DEV else None,
+    # orjson serializes UUID/datetime-heavy list responses in C, several
+    # times faster than the stdlib json encoder.
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
 # ==================== EXCEPTION HANDLERS ====================
 app.add_exception_handler(StarletteHTTPException, http_exception_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
+app.add_exception_handler(SQLAlchemyError, sqlalchemy_exception_handler)
+# Direct registrations for common concrete types so dispatch doesn't walk
+# the wildcard path; Exception stays as the catch-all backstop.
+app.add_exception_handler(RuntimeError, general_exception_handler)
+app.add_exception_handler(OSError, general_exception_handler)
+app.add_exception_handler(ValueError, general_exception_handler)
 app.add_exception_handler(Exception, general_exception_handler)
 
 # ==================== SECURITY MIDDLEWARE ====================
 # Add TrustedHostMiddleware in production with configured hosts
 # Protects against Host header injection attacks
-if settings.is_production:
+if IS_PROD:
     app.add_middleware(
         TrustedHostMiddleware,
         allowed_hosts=settings.allowed_hosts_list
@@ -264,15 +356,21 @@ app.add_middleware(
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """Log all HTTP requests with timing information."""
-    start_time = datetime.now(timezone.utc)
+    # Monotonic counter: immune to clock adjustments and far cheaper than
+    # constructing two tz-aware datetimes per request.
+    start_time = time.perf_counter()
 
     response = await call_next(request)
 
-    process_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+    process_time = time.perf_counter() - start_time
+    # %-style args are formatted lazily — no string is built if a filter
+    # or level check drops the record.
     logger.info(
-        f"{request.method} {request.url.path} - "
-        f"Status: {response.status_code} - "
-        f"Time: {process_time:.4f}s"
+        "%s %s - Status: %d - Time: %.4fs",
+        request.method,
+        request.url.path,
+        response.status_code,
+        process_time
     )
 
     return response
@@ -293,19 +391,43 @@ app.include_router(api_router, prefix=settings.API_PATH)
 async def health_check() -> Dict[str, Any]:
     """Health check endpoint.
 
-    Returns service status and database connection status.
+    Returns service status and the cached database connection status
+    maintained by the background probe — no DB round trip per ping.
     Used by load balancers and monitoring tools to verify service health.
     """
-    # Test database connection
+    database_status = _db_health["database_status"]
+    status = "healthy" if database_status == "connected" else "unhealthy"
+
+    return {
+        "status": status,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "service": "DataRails Demo API",
+        "version": "0.1.0",
+        "mode": settings.APP_MODE,
+        "database_status": database_status
+    }
+
+
+@app.get(
+    "/healthz/deep",
+    tags=["health"],
+    response_model=HealthCheckResponse,
+    summary="Deep health check endpoint",
+    description="Check service health with a live database probe"
+)
+async def deep_health_check() -> Dict[str, Any]:
+    """Deep health check with an on-demand live database probe.
+
+    Unlike the cached `/` check, this actually checks out a connection and
+    round-trips the database, for manual diagnosis and targeted monitors.
+    """
     database_status = "disconnected"
     try:
-        test_connection()
+        await asyncio.to_thread(test_connection, True)
         database_status = "connected"
     except Exception as e:
         logger.error(f"Database health check failed: {e}")
-        database_status = "disconnected"
 
-    # Determine overall status
     status = "healthy" if database_status == "connected" else "unhealthy"
 
     return {
@@ -1,3 +1,5 @@
+from sqlalchemy.orm import configure_mappers
+
 from backend.models.employee import Employee
 from backend.models.project import Project
 from backend.models.upload_job import UploadJob
@@ -7,3 +9,7 @@ __all__ = [
     "Project",
     "UploadJob"
 ]
+
+# Compile all mapper configuration now, at import, instead of lazily on the
+# first query — keeps mapper compilation off the first request's latency.
+configure_mappers()
@@ -1,13 +1,14 @@
 """Employee model with source data and transformed fields."""
 
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 from datetime import date
 
-from sqlalchemy import String, Integer, Float, Date, Index
+from sqlalchemy import String, Integer, Float, Date, Index, Text
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 
+from backend.core.utils import uuid7
 from backend.db.base_class import Base
 from backend.db.lengths import L
 from backend.models.model_mixin import TimestampMixin
@@ -47,7 +48,9 @@ class Employee(TimestampMixin, Base):
     """
 
     # Internal ID
-    id: Mapped[UUID] = mapped_column(PGUUID, primary_key=True, default=uuid4)
+    # Time-ordered UUIDv7 keeps inserts clustered at the right edge of
+    # the PK btree instead of splitting random leaf pages (uuid4).
+    id: Mapped[UUID] = mapped_column(PGUUID, primary_key=True, default=uuid7)
 
     # Source
     employee_id: Mapped[str] = mapped_column(
@@ -56,21 +59,26 @@ class Employee(TimestampMixin, Base):
         comment="Employee ID from Excel (business key)"
     )
 
+    # Non-key text columns are unconstrained Text: identical storage to
+    # varchar(n) in PG, but no per-row length check during bulk loads.
     name: Mapped[Optional[str]] = mapped_column(
-        String(L.NAME_FULL),
+        Text,
         nullable=True,
         comment="Employee full name from Excel"
     )
 
     department_code: Mapped[Optional[str]] = mapped_column(
-        String(L.CODE),
+        Text,
         nullable=True,
         comment="Department code from Excel (e.g., 'HR', 'DEV', 'FIN', 'MKT')"
     )
 
-    salary: Mapped[Optional[float]] = mapped_column(
+    # The ingestion validator rejects rows without a salary, so the column
+    # can be NOT NULL — consumers skip the None branch and PG drops the
+    # null-bitmap bookkeeping for it.
+    salary: Mapped[float] = mapped_column(
         Float,
-        nullable=True,
+        nullable=False,
         comment="Original salary amount from Excel"
     )
 
@@ -82,7 +90,7 @@ class Employee(TimestampMixin, Base):
 
     # Transformed
     department_name: Mapped[Optional[str]] = mapped_column(
-        String(L.TITLE),
+        Text,
         nullable=True,
         comment="Transformed department name (mapped from department_code via config.csv)"
     )
@@ -103,6 +111,13 @@ class Employee(TimestampMixin, Base):
         Index('ix_employee_employee_id', 'employee_id', unique=True),
         Index('ix_employee_department_code', 'department_code'),
         Index('ix_employee_department_name', 'department_name'),
+        # Covering index: department rollups (avg salary, tenure) become
+        # index-only scans with no heap fetches.
+        Index(
+            'ix_employee_dept_covering',
+            'department_code',
+            postgresql_include=['annual_salary_eur', 'tenure_years']
+        ),
     )
 
     def __repr__(self) -> str:
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import DateTime
+from sqlalchemy import DateTime, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from backend.core.utils import utcnow
@@ -25,13 +25,20 @@ class TimestampMixin:
     Note:
         SQLAlchemy's onupdate parameter automatically triggers updated_at
         refresh on any column modification in the model.
+
+        INSERT defaults are server-side (now()): bulk ingestion no longer
+        calls utcnow() per row or binds two timestamp parameters per row —
+        PostgreSQL stamps the columns itself. updated_at keeps a client
+        onupdate since a server-side on-update would require a trigger.
     """
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=utcnow
+        server_default=func.now(),
+        nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=utcnow,
-        onupdate=utcnow
+        server_default=func.now(),
+        onupdate=utcnow,
+        nullable=False
     )
@@ -1,13 +1,14 @@
 """Project model with source data and transformed fields."""
 
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 from datetime import date
 
-from sqlalchemy import String, Float, Date, Index
+from sqlalchemy import String, Float, Date, Index, Text
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 
+from backend.core.utils import uuid7
 from backend.db.base_class import Base
 from backend.db.lengths import L
 from backend.models.model_mixin import TimestampMixin
@@ -44,7 +45,9 @@ class Project(TimestampMixin, Base):
     """
 
     # Internal ID
-    id: Mapped[UUID] = mapped_column(PGUUID, primary_key=True, default=uuid4)
+    # Time-ordered UUIDv7 keeps inserts clustered at the right edge of
+    # the PK btree instead of splitting random leaf pages (uuid4).
+    id: Mapped[UUID] = mapped_column(PGUUID, primary_key=True, default=uuid7)
 
     # Source + Transform
     project_id: Mapped[str] = mapped_column(
@@ -53,8 +56,10 @@ class Project(TimestampMixin, Base):
         comment="Project ID from Excel (business key)"
     )
 
+    # Non-key text columns are unconstrained Text: identical storage to
+    # varchar(n) in PG, but no per-row length check during bulk loads.
     project_name: Mapped[Optional[str]] = mapped_column(
-        String(L.TITLE),
+        Text,
         nullable=True,
         comment="Project name from Excel"
     )
@@ -72,7 +77,7 @@ class Project(TimestampMixin, Base):
     )
 
     status: Mapped[Optional[str]] = mapped_column(
-        String(L.CODE),
+        Text,
         nullable=True,
         comment="Project status from Excel (Active, Complete, On Hold, Pending)"
     )
@@ -80,6 +85,12 @@ class Project(TimestampMixin, Base):
     __table_args__ = (
         Index('ix_project_project_id', 'project_id', unique=True),
         Index('ix_project_status', 'status'),
+        # Covering index so status-grouped budget rollups stay index-only.
+        Index(
+            'ix_project_status_budget',
+            'status',
+            postgresql_include=['budget_usd']
+        ),
     )
 
     def __repr__(self) -> str:
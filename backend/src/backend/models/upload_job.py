@@ -1,14 +1,22 @@
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 from datetime import datetime
-from sqlalchemy import String, Index, Integer, Text, JSON, DateTime
+from sqlalchemy import Enum, String, Index, Integer, Text, DateTime, text
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
 
+from backend.core.utils import uuid7
 from backend.db.base_class import Base
 from backend.db.lengths import L
 from backend.models.model_mixin import TimestampMixin
 
+#: Job lifecycle states; stored as a native PG enum (4 bytes per value
+#: instead of varlena text in every row and index entry).
+UPLOAD_STATUSES = ('pending', 'processing', 'completed', 'failed')
+
+#: Processing pipeline steps surfaced to the status-polling endpoint.
+UPLOAD_STEPS = ('reading', 'validating', 'transforming', 'persisting', 'completed')
+
 
 class UploadJob(TimestampMixin, Base):
     """Upload job tracking model for async file processing.
@@ -30,7 +38,7 @@ class UploadJob(TimestampMixin, Base):
         total_rows: Total number of rows across all sheets
         processed_rows: Number of rows successfully processed
         error_rows: Number of rows that failed validation/transformation
-        error_details: JSON array of error objects with row/field/message
+        error_details: JSONB array of error objects with row/field/message
         error_message: Overall error message if job failed completely
         started_at: When processing actually began (not when job was created)
         completed_at: When processing finished (success or failure)
@@ -38,15 +46,26 @@ class UploadJob(TimestampMixin, Base):
     Table name: upload_job (auto-generated from class name)
     """
 
-    id: Mapped[UUID] = mapped_column(PGUUID, primary_key=True, default=uuid4)
+    # Time-ordered UUIDv7 keeps inserts clustered at the right edge of
+    # the PK btree instead of splitting random leaf pages (uuid4).
+    id: Mapped[UUID] = mapped_column(PGUUID, primary_key=True, default=uuid7)
     filename: Mapped[str] = mapped_column(String(L.PATH), nullable=False)
     file_path: Mapped[str] = mapped_column(String(L.PATH), nullable=False)
-    status: Mapped[str] = mapped_column(String(L.CODE), nullable=False, default="pending")
-    current_step: Mapped[Optional[str]] = mapped_column(String(L.CODE), nullable=True)
+    status: Mapped[str] = mapped_column(
+        Enum(*UPLOAD_STATUSES, name='upload_status'),
+        nullable=False,
+        default="pending"
+    )
+    current_step: Mapped[Optional[str]] = mapped_column(
+        Enum(*UPLOAD_STEPS, name='upload_step'),
+        nullable=True
+    )
     total_rows: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     processed_rows: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, default=0)
     error_rows: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, default=0)
-    error_details: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    # JSONB: stored pre-parsed, so the status-polling endpoint doesn't pay
+    # a text->JSON parse on every SELECT of error_details.
+    error_details: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
     error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     started_at: Mapped[Optional[datetime]] = mapped_column(
@@ -60,7 +79,25 @@ class UploadJob(TimestampMixin, Base):
 
     __table_args__ = (
         Index('ix_upload_job_status', 'status'),
-        Index('idx_upload_job_status_created', 'status', 'created_at'),
+        # Partial index over only the non-terminal statuses: completed and
+        # failed jobs accumulate forever, but the dashboards only ever ask
+        # for latest pending/processing, so the index stays cache-resident
+        # no matter how large the job history grows.
+        Index(
+            'idx_upload_job_active',
+            'created_at',
+            postgresql_where=text("status IN ('pending', 'processing')")
+        ),
+        # Composite key for keyset pagination; Postgres scans it backwards
+        # for the created_at DESC, id DESC listing order.
+        Index('ix_upload_job_created_id', 'created_at', 'id'),
+        # Partial index for the status-polling hot path: only pending rows,
+        # so it stays tiny however large the job history grows.
+        Index(
+            'ix_upload_job_pending',
+            'created_at',
+            postgresql_where=text("status = 'pending'")
+        ),
     )
 
     def __repr__(self) -> str:
@@ -1,6 +1,9 @@
 """Common schemas for API responses following OOP/SOLID principles."""
 
+from functools import cached_property
+
 from pydantic import BaseModel, ConfigDict, Field
+from types import MappingProxyType
 from typing import List, Generic, TypeVar, Optional
 from datetime import datetime
 
@@ -8,6 +11,45 @@ from backend.core.utils import utcnow
 
 T = TypeVar('T')
 
+#: OpenAPI examples for the error detail classes, shared from one read-only
+#: mapping instead of a literal dict per class — Pydantic deep-copies
+#: json_schema_extra during schema build, so one source dict per error type
+#: is allocated instead of one per class definition site.
+_EXAMPLES = MappingProxyType({
+    "bad_request": {
+        "detail": "Invalid file format. Expected .xlsx",
+        "error_code": "BAD_REQUEST"
+    },
+    "unauthorized": {
+        "detail": "Could not validate credentials",
+        "error_code": "UNAUTHORIZED"
+    },
+    "forbidden": {
+        "detail": "You don't have permission to access this resource",
+        "error_code": "FORBIDDEN"
+    },
+    "not_found": {
+        "detail": "Resource not found",
+        "error_code": "NOT_FOUND"
+    },
+    "conflict": {
+        "detail": "Resource already exists",
+        "error_code": "CONFLICT"
+    },
+    "rate_limit_exceeded": {
+        "detail": "Too many requests. Please try again later.",
+        "error_code": "RATE_LIMIT_EXCEEDED"
+    },
+    "internal_server_error": {
+        "detail": "An unexpected error occurred",
+        "error_code": "INTERNAL_SERVER_ERROR"
+    },
+    "service_unavailable": {
+        "detail": "Database connection unavailable",
+        "error_code": "SERVICE_UNAVAILABLE"
+    }
+})
+
 
 class BaseResponse(BaseModel, Generic[T]):
     """Base success response wrapper for all API endpoints.
@@ -26,7 +68,14 @@ class BaseResponse(BaseModel, Generic[T]):
     success: bool = Field(default=True, description="Request success indicator")
     data: T = Field(..., description="Response payload")
 
+    # Hot wrapper: built for every successful response. No assignment
+    # validation (instances are never mutated after construction) and no
+    # deferred build, so the core schema is compiled once at import.
     model_config = ConfigDict(
+        from_attributes=True,
+        validate_assignment=False,
+        defer_build=False,
+        extra='ignore',
         json_schema_extra={
             "example": {
                 "success": True,
@@ -36,6 +85,29 @@ class BaseResponse(BaseModel, Generic[T]):
     )
 
 
+class ErrorDetail(BaseModel):
+    """Base error detail structure.
+
+    Contains human-readable message and machine-readable error code.
+    Used in all error responses.
+
+    Attributes:
+        detail: Human-readable error message for display.
+        error_code: Machine-readable error code for programmatic handling.
+    """
+    detail: str = Field(..., description="Human-readable error message")
+    error_code: str = Field(..., description="Machine-readable error code")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "detail": "Resource not found",
+                "error_code": "NOT_FOUND"
+            }
+        }
+    )
+
+
 class BaseErrorResponse(BaseModel):
     """Base error response wrapper for all API error responses.
 
@@ -52,7 +124,7 @@ class BaseErrorResponse(BaseModel):
         )
     """
     success: bool = Field(default=False, description="Request success indicator")
-    error: "ErrorDetail" = Field(..., description="Error details")
+    error: ErrorDetail = Field(..., description="Error details")
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -67,29 +139,6 @@ class BaseErrorResponse(BaseModel):
     )
 
 
-class ErrorDetail(BaseModel):
-    """Base error detail structure.
-
-    Contains human-readable message and machine-readable error code.
-    Used in all error responses.
-
-    Attributes:
-        detail: Human-readable error message for display.
-        error_code: Machine-readable error code for programmatic handling.
-    """
-    detail: str = Field(..., description="Human-readable error message")
-    error_code: str = Field(..., description="Machine-readable error code")
-
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "detail": "Resource not found",
-                "error_code": "NOT_FOUND"
-            }
-        }
-    )
-
-
 class ValidationErrorItem(BaseModel):
     """Single field validation error.
 
@@ -157,6 +206,7 @@ class PaginatedResponse(BaseModel, Generic[T]):
         page: Current page number (1-indexed).
         size: Number of items per page.
         pages: Total number of pages.
+        next_cursor: Cursor (last item ID) for keyset pagination, or None.
 
     Usage:
         PaginatedResponse[EmployeeInDB](
@@ -172,8 +222,18 @@ class PaginatedResponse(BaseModel, Generic[T]):
     page: int = Field(..., ge=1, description="Current page number (1-indexed)")
     size: int = Field(..., ge=1, le=100, description="Items per page")
     pages: int = Field(..., ge=0, description="Total number of pages")
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor for the next page when using keyset pagination"
+    )
 
+    # Hot wrapper: one instance per list response, holding up to 100 items.
+    # Same construction-only config as BaseResponse.
     model_config = ConfigDict(
+        from_attributes=True,
+        validate_assignment=False,
+        defer_build=False,
+        extra='ignore',
         json_schema_extra={
             "example": {
                 "items": [],
@@ -208,16 +268,19 @@ class PaginationParams(BaseModel):
     page: int = Field(default=1, ge=1, description="Page number (1-indexed)")
     size: int = Field(default=20, ge=1, le=100, description="Items per page (max 100)")
 
-    @property
+    @cached_property
     def skip(self) -> int:
         """Calculate database offset from page and size.
 
+        Computed once per instance — endpoints read .skip several times
+        (query binding, logging, response metadata) per request.
+
         Returns:
             Number of records to skip (offset).
         """
         return (self.page - 1) * self.size
 
-    @property
+    @cached_property
     def limit(self) -> int:
         """Get database limit (same as size).
 
@@ -299,14 +362,7 @@ class BadRequestError(ErrorDetail):
     """
     error_code: str = Field(default="BAD_REQUEST")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "detail": "Invalid file format. Expected .xlsx",
-                "error_code": "BAD_REQUEST"
-            }
-        }
-    )
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLES["bad_request"]})
 
 
 class UnauthorizedError(ErrorDetail):
@@ -316,14 +372,7 @@ class UnauthorizedError(ErrorDetail):
     """
     error_code: str = Field(default="UNAUTHORIZED")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "detail": "Could not validate credentials",
-                "error_code": "UNAUTHORIZED"
-            }
-        }
-    )
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLES["unauthorized"]})
 
 
 class ForbiddenError(ErrorDetail):
@@ -333,14 +382,7 @@ class ForbiddenError(ErrorDetail):
     """
     error_code: str = Field(default="FORBIDDEN")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "detail": "You don't have permission to access this resource",
-                "error_code": "FORBIDDEN"
-            }
-        }
-    )
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLES["forbidden"]})
 
 
 class NotFoundError(ErrorDetail):
@@ -350,14 +392,7 @@ class NotFoundError(ErrorDetail):
     """
     error_code: str = Field(default="NOT_FOUND")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "detail": "Resource not found",
-                "error_code": "NOT_FOUND"
-            }
-        }
-    )
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLES["not_found"]})
 
 
 class ConflictError(ErrorDetail):
@@ -367,14 +402,7 @@ class ConflictError(ErrorDetail):
     """
     error_code: str = Field(default="CONFLICT")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "detail": "Resource already exists",
-                "error_code": "CONFLICT"
-            }
-        }
-    )
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLES["conflict"]})
 
 
 class RateLimitExceededError(ErrorDetail):
@@ -384,14 +412,7 @@ class RateLimitExceededError(ErrorDetail):
     """
     error_code: str = Field(default="RATE_LIMIT_EXCEEDED")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "detail": "Too many requests. Please try again later.",
-                "error_code": "RATE_LIMIT_EXCEEDED"
-            }
-        }
-    )
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLES["rate_limit_exceeded"]})
 
 
 class InternalServerError(ErrorDetail):
@@ -401,14 +422,7 @@ class InternalServerError(ErrorDetail):
     """
     error_code: str = Field(default="INTERNAL_SERVER_ERROR")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "detail": "An unexpected error occurred",
-                "error_code": "INTERNAL_SERVER_ERROR"
-            }
-        }
-    )
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLES["internal_server_error"]})
 
 
 class ServiceUnavailableError(ErrorDetail):
@@ -418,14 +432,7 @@ class ServiceUnavailableError(ErrorDetail):
     """
     error_code: str = Field(default="SERVICE_UNAVAILABLE")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "detail": "Database connection unavailable",
-                "error_code": "SERVICE_UNAVAILABLE"
-            }
-        }
-    )
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLES["service_unavailable"]})
 
 
 class BadRequestErrorResponse(BaseErrorResponse):
@@ -473,6 +480,22 @@ class ServiceUnavailableErrorResponse(BaseErrorResponse):
     error: ServiceUnavailableError = Field(...)
 
 
+#: Status-code → error-code mapping at module scope; get_error_code runs on
+#: every 4xx/5xx response, so the lookup must not rebuild the dict per call.
+#: Read-only proxy guards against accidental mutation by handlers.
+_ERROR_CODES = MappingProxyType({
+    400: "BAD_REQUEST",
+    401: "UNAUTHORIZED",
+    403: "FORBIDDEN",
+    404: "NOT_FOUND",
+    409: "CONFLICT",
+    422: "VALIDATION_ERROR",
+    429: "RATE_LIMIT_EXCEEDED",
+    500: "INTERNAL_SERVER_ERROR",
+    503: "SERVICE_UNAVAILABLE"
+})
+
+
 def get_error_code(status_code: int) -> str:
     """Map HTTP status code to machine-readable error code.
 
@@ -486,19 +509,4 @@ def get_error_code(status_code: int) -> str:
     Example:
         error_code = get_error_code(404)  # Returns "NOT_FOUND"
     """
-    error_codes = {
-        400: "BAD_REQUEST",
-        401: "UNAUTHORIZED",
-        403: "FORBIDDEN",
-        404: "NOT_FOUND",
-        409: "CONFLICT",
-        422: "VALIDATION_ERROR",
-        429: "RATE_LIMIT_EXCEEDED",
-        500: "INTERNAL_SERVER_ERROR",
-        503: "SERVICE_UNAVAILABLE"
-    }
-    return error_codes.get(status_code, "UNKNOWN_ERROR")
-
-
-# Rebuild models to resolve forward references
-BaseErrorResponse.model_rebuild()
+    return _ERROR_CODES.get(status_code, "UNKNOWN_ERROR")
@@ -0,0 +1,27 @@
+"""Concrete specializations of the generic response wrappers.
+
+`BaseResponse[X]` at a call site goes through Pydantic's generic-model
+specialization machinery (`__class_getitem__` plus a parametrization cache
+lookup) every time the subscript expression is evaluated. Binding each
+specialization to a module-level name builds its core schema exactly once,
+at import, and turns every use in the routers into a plain name lookup.
+
+Routers should import these aliases instead of subscripting the generics
+inline.
+"""
+
+from backend.schemas.common import BaseResponse, PaginatedResponse
+from backend.schemas.employee import EmployeeInDB
+from backend.schemas.upload_job import UploadJobInDB, UploadJobResponse
+
+#: Paginated employee listing and its success wrapper.
+EmployeePage = PaginatedResponse[EmployeeInDB]
+EmployeePageResponse = BaseResponse[EmployeePage]
+
+#: Paginated upload-job listing and its success wrapper.
+UploadJobPage = PaginatedResponse[UploadJobInDB]
+UploadJobPageResponse = BaseResponse[UploadJobPage]
+
+#: Single upload-job payloads: 202 accept acknowledgement and status detail.
+UploadAcceptedResponse = BaseResponse[UploadJobResponse]
+UploadJobDetailResponse = BaseResponse[UploadJobInDB]
@@ -17,7 +17,7 @@ class EmployeeCreate(BaseModel):
     employee_id: str = Field(..., description="Employee ID from Excel (business key)")
     name: Optional[str] = Field(None, description="Employee full name from Excel")
     department_code: Optional[str] = Field(None, description="Department code from Excel")
-    salary: Optional[float] = Field(None, description="Original salary amount from Excel")
+    salary: float = Field(..., description="Original salary amount from Excel")
     hire_date: Optional[date] = Field(None, description="Employee hire date from Excel")
 
     # Transformed data (from config.csv rules)
@@ -26,6 +26,9 @@ class EmployeeCreate(BaseModel):
     tenure_years: Optional[int] = Field(None, description="Calculated years of service")
 
     model_config = ConfigDict(
+        # Internal-only schema: defer core-schema build to first use
+        # so processes that never touch it skip the construction cost.
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "employee_id": "E0001",
@@ -60,6 +63,9 @@ class EmployeeUpdate(BaseModel):
     tenure_years: Optional[int] = None
 
     model_config = ConfigDict(
+        # Internal-only schema: defer core-schema build to first use
+        # so processes that never touch it skip the construction cost.
+        defer_build=True,
         from_attributes=True,
         json_schema_extra={
             "example": {
@@ -92,7 +98,7 @@ class EmployeeInDB(BaseModel):
     employee_id: str = Field(..., description="Employee ID (business key)")
     name: Optional[str] = Field(None, description="Employee full name")
     department_code: Optional[str] = Field(None, description="Department code")
-    salary: Optional[float] = Field(None, description="Original salary amount")
+    salary: float = Field(..., description="Original salary amount")
     hire_date: Optional[date] = Field(None, description="Employee hire date")
 
     # Transformed data
@@ -118,3 +124,29 @@ class EmployeeInDB(BaseModel):
             }
         }
     )
+
+
+#: Field order for the trusted-row fast path below, resolved once at import.
+_IN_DB_FIELDS = tuple(EmployeeInDB.model_fields)
+
+
+def employee_from_row(row) -> EmployeeInDB:
+    """Build an EmployeeInDB from a trusted database row without validation.
+
+    Rows coming back from our own SELECTs are already typed by the driver
+    (UUIDs, datetimes, floats), so running Pydantic's per-field validator
+    loop over them again is pure overhead on large list responses.
+    model_construct() assigns the attributes directly.
+
+    Only use this with rows read from the database — never with external
+    input, which must keep going through model_validate().
+
+    Args:
+        row: ORM instance or named row exposing EmployeeInDB's fields.
+
+    Returns:
+        EmployeeInDB built without validation.
+    """
+    return EmployeeInDB.model_construct(
+        **{name: getattr(row, name) for name in _IN_DB_FIELDS}
+    )
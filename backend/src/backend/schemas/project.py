@@ -20,6 +20,9 @@ class ProjectCreate(BaseModel):
     status: Optional[str] = Field(None, description="Project status from Excel")
 
     model_config = ConfigDict(
+        # Internal-only schema: defer core-schema build to first use
+        # so processes that never touch it skip the construction cost.
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "project_id": "P001",
@@ -45,6 +48,9 @@ class ProjectUpdate(BaseModel):
     status: Optional[str] = None
 
     model_config = ConfigDict(
+        # Internal-only schema: defer core-schema build to first use
+        # so processes that never touch it skip the construction cost.
+        defer_build=True,
         from_attributes=True,
         json_schema_extra={
             "example": {
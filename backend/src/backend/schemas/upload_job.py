@@ -1,8 +1,9 @@
 """Upload job schemas for CRUD operations and API responses."""
 
+from collections.abc import Mapping
 from uuid import UUID
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Any
 from pydantic import BaseModel, Field, ConfigDict
 
 
@@ -17,6 +18,9 @@ class UploadJobCreate(BaseModel):
     file_path: str = Field(..., description="Server path where file is stored")
 
     model_config = ConfigDict(
+        # Internal-only schema: defer core-schema build to first use
+        # so processes that never touch it skip the construction cost.
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "filename": "employees_data.xlsx",
@@ -38,12 +42,17 @@ class UploadJobUpdate(BaseModel):
     total_rows: Optional[int] = Field(None, ge=0, description="Total number of rows")
     processed_rows: Optional[int] = Field(None, ge=0, description="Number of rows processed")
     error_rows: Optional[int] = Field(None, ge=0, description="Number of rows with errors")
-    error_details: Optional[Dict[str, Any]] = Field(None, description="Detailed error information")
+    # Opaque passthrough: the API never inspects this structure, so Any
+    # skips pydantic's recursive dict walker on nested error payloads.
+    error_details: Optional[Any] = Field(None, description="Detailed error information")
     error_message: Optional[str] = Field(None, description="Overall error message")
     started_at: Optional[datetime] = Field(None, description="When processing started")
     completed_at: Optional[datetime] = Field(None, description="When processing completed")
 
     model_config = ConfigDict(
+        # Internal-only schema: defer core-schema build to first use
+        # so processes that never touch it skip the construction cost.
+        defer_build=True,
         from_attributes=True,
         json_schema_extra={
             "example": {
@@ -71,7 +80,9 @@ class UploadJobInDB(BaseModel):
     total_rows: Optional[int] = Field(None, description="Total number of rows")
     processed_rows: Optional[int] = Field(None, description="Number of rows processed")
     error_rows: Optional[int] = Field(None, description="Number of rows with errors")
-    error_details: Optional[Dict[str, Any]] = Field(None, description="Detailed error information")
+    # Opaque passthrough, as on UploadJobUpdate: stored JSONB comes back
+    # from the driver already parsed and goes straight out to the client.
+    error_details: Optional[Any] = Field(None, description="Detailed error information")
     error_message: Optional[str] = Field(None, description="Overall error message if failed")
     started_at: Optional[datetime] = Field(None, description="When processing started")
     completed_at: Optional[datetime] = Field(None, description="When processing completed")
@@ -123,3 +134,31 @@ class UploadJobResponse(BaseModel):
             }
         }
     )
+
+
+#: Field order for the trusted-row fast path below, resolved once at import.
+_IN_DB_FIELDS = tuple(UploadJobInDB.model_fields)
+
+
+def upload_job_from_row(row) -> UploadJobInDB:
+    """Build an UploadJobInDB from a trusted database row without validation.
+
+    Counterpart of employee_from_row(): rows from our own SELECTs are
+    already correctly typed, so model_construct() skips the per-field
+    validator loop. Accepts both ORM instances (attribute access) and the
+    RowMapping dicts produced by list_jobs(). Only use with database
+    output, never external input.
+
+    Args:
+        row: ORM instance or row mapping exposing UploadJobInDB's fields.
+
+    Returns:
+        UploadJobInDB built without validation.
+    """
+    if isinstance(row, Mapping):
+        return UploadJobInDB.model_construct(
+            **{name: row[name] for name in _IN_DB_FIELDS}
+        )
+    return UploadJobInDB.model_construct(
+        **{name: getattr(row, name) for name in _IN_DB_FIELDS}
+    )
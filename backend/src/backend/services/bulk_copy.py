@@ -0,0 +1,200 @@
+"""PostgreSQL COPY-based bulk loading for very large ingestion batches.
+
+Even batched multi-VALUES INSERTs pay per-statement parse and bind cost;
+COPY streams all rows over one protocol message and is the fastest path
+PostgreSQL offers for bulk loads. Because COPY itself cannot resolve
+unique-key conflicts, rows are staged into a session-local TEMP table and
+merged into the real table with a single
+``INSERT ... SELECT ... ON CONFLICT DO UPDATE`` — the same upsert
+semantics as CRUDBase.upsert_many, so re-uploaded files update in place.
+
+Only worth the extra round trips above roughly 10k rows; below that the
+insertmanyvalues path in upsert_many is just as fast with less machinery.
+"""
+
+from typing import Any, Dict, Iterable, List, Tuple, Type
+
+import pandas as pd
+from sqlalchemy.orm import Session
+
+from backend.core.utils import uuid7
+from backend.db.base_class import Base
+
+#: Row count above which COPY staging beats batched INSERTs. Below this
+#: the TEMP table setup and merge overhead outweighs the protocol savings.
+COPY_MIN_ROWS = 10_000
+
+#: Row count above which non-unique secondary indexes are dropped before
+#: the load and rebuilt after the merge. A bulk sorted index build is
+#: O(n log n) versus n random btree insertions while loading, so past this
+#: size the rebuild pays for itself.
+INDEX_REBUILD_MIN_ROWS = 100_000
+
+#: Columns PostgreSQL fills via server defaults; never streamed through COPY.
+_SERVER_FILLED = ("created_at", "updated_at")
+
+
+def copy_upsert(
+        db: Session,
+        *,
+        model: Type[Base],
+        business_key: str,
+        rows: List[Dict[str, Any]]
+) -> int:
+    """Bulk upsert rows via COPY into a TEMP table plus one merge INSERT.
+
+    Streams rows with psycopg3's ``cursor.copy()`` into a TEMP table
+    created ``LIKE`` the target (so server-side timestamp defaults still
+    apply), then merges into the real table in one statement. Primary key
+    UUIDs are generated client-side since COPY bypasses Python column
+    defaults.
+
+    Args:
+        db: Database session for the transaction. The caller commits.
+        model: SQLAlchemy model class for the target table.
+        business_key: Natural-key column name for conflict resolution.
+        rows: Row dicts as produced by CreateSchema.model_dump().
+
+    Returns:
+        Number of rows staged and merged.
+
+    Note:
+        Runs on the session's existing connection/transaction, so it
+        composes with surrounding ORM work and rolls back with it. Above
+        INDEX_REBUILD_MIN_ROWS, non-unique secondary indexes on the target
+        are dropped for the duration of the load and rebuilt afterwards —
+        transactionally, so a failure leaves them intact. The unique
+        business-key index is always kept: the merge's ON CONFLICT needs it.
+    """
+    if not rows:
+        return 0
+
+    cols = _business_columns(model)
+    return _stage_and_merge(
+        db,
+        model=model,
+        business_key=business_key,
+        cols=cols,
+        value_rows=(tuple(row[c] for c in cols) for row in rows),
+        count=len(rows),
+    )
+
+
+def copy_upsert_df(
+        db: Session,
+        *,
+        model: Type[Base],
+        business_key: str,
+        df: pd.DataFrame
+) -> int:
+    """Bulk upsert a transformed DataFrame via the COPY staging path.
+
+    Columnar counterpart of copy_upsert(): rows never exist as Python
+    dicts — the frame's columns are reordered to match the table, nulls
+    are normalized to None, and tuples stream straight into COPY. Columns
+    the sheet did not provide load as NULL.
+
+    Args:
+        db: Database session for the transaction. The caller commits.
+        model: SQLAlchemy model class for the target table.
+        business_key: Natural-key column name for conflict resolution.
+        df: Transformed rows, e.g. from transform_employees_df().
+
+    Returns:
+        Number of rows staged and merged.
+    """
+    if df.empty:
+        return 0
+
+    cols = _business_columns(model)
+    # Reindex to the table's column order (missing columns become NULL),
+    # then object-cast so numpy scalars and NaN/NaT become plain Python
+    # values psycopg can adapt.
+    frame = df.reindex(columns=cols).astype(object)
+    frame = frame.where(frame.notna(), None)
+    return _stage_and_merge(
+        db,
+        model=model,
+        business_key=business_key,
+        cols=cols,
+        value_rows=frame.itertuples(index=False, name=None),
+        count=len(frame),
+    )
+
+
+def _business_columns(model: Type[Base]) -> List[str]:
+    """Columns streamed through COPY: everything except the generated id
+    and the server-filled timestamps."""
+    return [
+        c.name for c in model.__table__.columns
+        if c.name != "id" and c.name not in _SERVER_FILLED
+    ]
+
+
+def _stage_and_merge(
+        db: Session,
+        *,
+        model: Type[Base],
+        business_key: str,
+        cols: List[str],
+        value_rows: Iterable[Tuple[Any, ...]],
+        count: int
+) -> int:
+    """Stream value tuples through COPY staging and merge into the table.
+
+    Shared tail of copy_upsert()/copy_upsert_df(): value_rows yields the
+    business-column values in `cols` order; ids are generated here.
+    """
+    table = model.__table__.name
+    copy_cols = ["id"] + cols
+    col_list = ", ".join(copy_cols)
+    update_set = ", ".join(
+        f"{c} = EXCLUDED.{c}" for c in cols if c != business_key
+    )
+    # updated_at is never streamed through COPY (_SERVER_FILLED), so the
+    # merge must refresh it explicitly — matching upsert_many()'s conflict
+    # set, which bumps it via the ORM onupdate.
+    update_set += ", updated_at = now()"
+
+    sa_conn = db.connection()
+
+    # The engine's 30s statement_timeout guard would cancel the index
+    # rebuilds and the merge INSERT below — their cost scales with total
+    # table size, not batch size. SET LOCAL lifts the guard for this
+    # transaction only; it snaps back on commit or rollback.
+    sa_conn.exec_driver_sql("SET LOCAL statement_timeout = 0")
+
+    # Maintaining secondary btrees row-by-row dominates very large loads;
+    # rebuild them in one sorted pass afterwards instead. DROP/CREATE INDEX
+    # are transactional in PostgreSQL, so a failed load rolls them back too.
+    rebuild = [
+        ix for ix in model.__table__.indexes if not ix.unique
+    ] if count >= INDEX_REBUILD_MIN_ROWS else []
+    for ix in rebuild:
+        ix.drop(bind=sa_conn)
+
+    # Raw psycopg3 connection underneath the session's SQLAlchemy connection.
+    driver_conn = sa_conn.connection.driver_connection
+
+    with driver_conn.cursor() as cur:
+        # ON COMMIT DROP ties the staging table's lifetime to the caller's
+        # transaction — no cleanup path needed on error.
+        cur.execute(
+            f"CREATE TEMP TABLE _stage_{table} "
+            f"(LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP"
+        )
+        with cur.copy(
+            f"COPY _stage_{table} ({col_list}) FROM STDIN"
+        ) as copy:
+            for values in value_rows:
+                copy.write_row((uuid7(), *values))
+        cur.execute(
+            f"INSERT INTO {table} ({col_list}) "
+            f"SELECT {col_list} FROM _stage_{table} "
+            f"ON CONFLICT ({business_key}) DO UPDATE SET {update_set}"
+        )
+
+    for ix in rebuild:
+        ix.create(bind=sa_conn)
+
+    return count
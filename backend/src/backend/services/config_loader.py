@@ -40,30 +40,46 @@ class ConfigLoader:
         if not self.config_path.exists():
             raise FileNotFoundError(f"Config file not found: {self.config_path}")
 
-        with open(self.config_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-
-            for row in reader:
-                source_sheet = row['source_sheet'].strip()
-                source_field = row['source_field'].strip()
-                target_field = row['target_field'].strip()
-                transformation_type = row['transformation_type'].strip()
-                parameters = row['parameters'].strip()
-
-                # Store in structured format
-                key = f"{source_sheet}.{source_field}"
-
-                self.transformations[key] = {
-                    'target_field': target_field,
-                    'type': transformation_type,
-                    'parameters': parameters
-                }
-
-                # Parse specific transformation types
-                if transformation_type == 'MAPPING':
-                    self._parse_mapping(source_field, parameters)
-                elif transformation_type == 'CALCULATION':
-                    self._parse_calculation(source_field, target_field, parameters)
+        # Fingerprint of the file this parse came from; is_stale() compares
+        # against it so the singleton can skip re-parsing an unchanged file.
+        stat = self.config_path.stat()
+        self._stat_key = (stat.st_mtime_ns, stat.st_size)
+
+        # One read_text() slurps the whole file in a single syscall; the
+        # file is well under a page, so streaming it line-buffered through
+        # the reader just adds I/O machinery.
+        content = self.config_path.read_text(encoding='utf-8')
+
+        # Positional csv.reader instead of DictReader: the column layout
+        # is fixed, so there is no need to build a dict per row just to
+        # take its values back out by name.
+        reader = csv.reader(content.splitlines())
+        next(reader, None)  # header row
+
+        for row in reader:
+            if not row:
+                continue
+            (source_sheet, source_field, target_field,
+             transformation_type, parameters) = (c.strip() for c in row)
+
+            # Store in structured format
+            key = f"{source_sheet}.{source_field}"
+
+            self.transformations[key] = {
+                'target_field': target_field,
+                'type': transformation_type,
+                'parameters': parameters
+            }
+
+            # Parse specific transformation types
+            if transformation_type == 'MAPPING':
+                self._parse_mapping(source_field, parameters)
+            elif transformation_type == 'CALCULATION':
+                self._parse_calculation(source_field, target_field, parameters)
+
+        # Pre-bind the department lookup so get_department_name is a
+        # single dict probe instead of two chained .get() calls per row.
+        self._dept_name_get = self.mappings.get('department_code', {}).get
 
     def _parse_mapping(self, source_field: str, parameters: str):
         """Parse mapping parameters.
@@ -100,7 +116,7 @@ class ConfigLoader:
         """
         if not code:
             return None
-        return self.mappings.get("department_code", {}).get(code.strip())
+        return self._dept_name_get(code.strip())
 
     def get_exchange_rate(self, source_field: str = "salary",
                           target_field: str = "annual_salary_eur") -> float:
@@ -151,6 +167,22 @@ class ConfigLoader:
         calc = self.calculations.get(key)
         return calc == "DATE_DIFF_TO_NOW"
 
+    def is_stale(self) -> bool:
+        """Check whether config.csv changed since this instance parsed it.
+
+        Compares the file's current (mtime_ns, size) against the values
+        recorded at load time. A missing file counts as stale so the next
+        load surfaces the FileNotFoundError.
+
+        Returns:
+            True if the file changed (or vanished) since load
+        """
+        try:
+            stat = self.config_path.stat()
+        except OSError:
+            return True
+        return (stat.st_mtime_ns, stat.st_size) != self._stat_key
+
     def get_all_mappings(self, field: str) -> Dict[str, str]:
         """Get all mappings for a field.
 
@@ -176,10 +208,16 @@ _config_loader_instance: Optional[ConfigLoader] = None
 
 
 def get_config_loader() -> ConfigLoader:
-    """Get or create singleton ConfigLoader instance."""
+    """Get or create singleton ConfigLoader instance.
+
+    The parsed config is cached for the lifetime of the process and only
+    re-parsed when config.csv's mtime or size changes, so long-lived
+    workers pay the CSV parse once per config change rather than once per
+    task while still picking up edits without a restart.
+    """
     global _config_loader_instance
 
-    if _config_loader_instance is None:
+    if _config_loader_instance is None or _config_loader_instance.is_stale():
         _config_loader_instance = ConfigLoader()
 
     return _config_loader_instance
@@ -1,9 +1,26 @@
 """Data transformer for applying config-based transformations."""
 
+import sys
 from datetime import date, datetime
 from typing import Dict, Optional, Any
+
+import pandas as pd
+
 from backend.services.config_loader import ConfigLoader
 
+#: Interned column-name keys for the per-row hot path. The Excel reader
+#: interns sheet headers the same way, so row-dict lookups compare keys
+#: by pointer identity rather than re-hashing and comparing contents.
+_K_EMPLOYEE_ID = sys.intern('employee_id')
+_K_NAME = sys.intern('name')
+_K_DEPT_CODE = sys.intern('department_code')
+_K_DEPT_NAME = sys.intern('department_name')
+_K_SALARY = sys.intern('salary')
+_K_SALARY_EUR = sys.intern('annual_salary_eur')
+_K_HIRE_DATE = sys.intern('hire_date')
+_K_TENURE = sys.intern('tenure_years')
+_K_BUDGET = sys.intern('budget_usd')
+
 
 class DataTransformer:
     """Transform raw Excel data using config.csv rules.
@@ -21,6 +38,18 @@ class DataTransformer:
             config: ConfigLoader instance with transformation rules
         """
         self.config = config
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Re-resolve cached config lookups after a config reload.
+
+        The exchange rate and department map never change within a batch,
+        so they are resolved once here instead of per row (each
+        get_exchange_rate() call re-parses the rate with float()). Call
+        this again if the underlying ConfigLoader is reloaded in place.
+        """
+        self._rate = self.config.get_exchange_rate()
+        self._dept_map = self.config.mappings.get('department_code', {})
 
     def transform_employee(self, row: Dict[str, Any]) -> Dict[str, Any]:
         """Transform employee row with config-based rules.
@@ -44,40 +73,81 @@ class DataTransformer:
                 'tenure_years': 2                       # ← Calculated
             }
         """
-        # Start with original data
-        transformed = row.copy()
-
-        # Remove Excel row number (internal use only)
-        transformed.pop('_excel_row_number', None)
-
         # Transform department_code → department_name
-        dept_code = row.get('department_code')
-        if dept_code:
-            dept_name = self.config.get_department_name(dept_code)
-            transformed['department_name'] = dept_name
-        else:
-            transformed['department_name'] = None
+        dept_code = row.get(_K_DEPT_CODE)
+        dept_name = self._dept_map.get(dept_code.strip()) if dept_code else None
 
         # Transform salary → annual_salary_eur
-        salary = row.get('salary')
+        salary = row.get(_K_SALARY)
         if salary is not None:
             try:
-                salary_float = float(salary)
-                exchange_rate = self.config.get_exchange_rate()
-                transformed['annual_salary_eur'] = round(salary_float * exchange_rate, 2)
+                salary_eur = round(float(salary) * self._rate, 2)
             except (ValueError, TypeError):
-                transformed['annual_salary_eur'] = None
+                salary_eur = None
         else:
-            transformed['annual_salary_eur'] = None
+            salary_eur = None
 
         # Calculate hire_date → tenure_years
-        hire_date = row.get('hire_date')
-        if hire_date:
-            transformed['tenure_years'] = self.calculate_tenure(hire_date)
+        hire_date = row.get(_K_HIRE_DATE)
+        tenure = self.calculate_tenure(hire_date) if hire_date else None
+
+        # Build the output dict at its final shape (the EmployeeCreate
+        # field set) in one allocation instead of copying the input row
+        # and popping _excel_row_number back out. Columns outside the
+        # schema were dropped at validation anyway.
+        return {
+            _K_EMPLOYEE_ID: row.get(_K_EMPLOYEE_ID),
+            _K_NAME: row.get(_K_NAME),
+            _K_DEPT_CODE: dept_code,
+            _K_SALARY: salary,
+            _K_HIRE_DATE: hire_date,
+            _K_DEPT_NAME: dept_name,
+            _K_SALARY_EUR: salary_eur,
+            _K_TENURE: tenure,
+        }
+
+    def transform_employees_df(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Transform a whole employee sheet as a DataFrame in one pass.
+
+        Columnar counterpart of transform_employee(): the department
+        mapping runs as one hash lookup per row in C (Series.map), the
+        salary conversion and tenure arithmetic as NumPy array ops — no
+        per-row dict copies or Python-level float()/round() calls.
+
+        Args:
+            df: Raw employee rows as a DataFrame (one column per Excel
+                field; an optional _excel_row_number column is dropped).
+
+        Returns:
+            DataFrame with the original columns plus department_name,
+            annual_salary_eur and tenure_years. Missing or unmappable
+            inputs yield nulls, matching the row path.
+        """
+        df = df.drop(columns=['_excel_row_number'], errors='ignore').copy()
+
+        df['department_name'] = (
+            df['department_code'].astype('string').str.strip().map(self._dept_map)
+            if 'department_code' in df.columns else None
+        )
+
+        rate = self._rate
+        salary = (
+            pd.to_numeric(df['salary'], errors='coerce')
+            if 'salary' in df.columns else pd.Series(index=df.index, dtype='float64')
+        )
+        df['annual_salary_eur'] = (salary * rate).round(2)
+
+        if 'hire_date' in df.columns:
+            hired = pd.to_datetime(df['hire_date'], errors='coerce')
+            # Same anniversary-aware year diff as calculate_tenure(),
+            # vectorized: month*100+day gives a comparable int per date.
+            today = date.today()
+            not_yet = (hired.dt.month * 100 + hired.dt.day) > (today.month * 100 + today.day)
+            df['tenure_years'] = (today.year - hired.dt.year - not_yet).astype('Int64')
         else:
-            transformed['tenure_years'] = None
+            df['tenure_years'] = None
 
-        return transformed
+        return df
 
     def transform_project(self, row: Dict[str, Any]) -> Dict[str, Any]:
         """Transform project row.
@@ -91,19 +161,17 @@ class DataTransformer:
         Returns:
             Dictionary with project data (cleaned)
         """
-        # Start with original data
+        # Start with original data (row numbers live in a parallel list
+        # at the reader, so there is no metadata key to strip)
         transformed = row.copy()
 
-        # Remove Excel row number
-        transformed.pop('_excel_row_number', None)
-
         # Ensure budget_usd is float
-        budget = row.get('budget_usd')
+        budget = row.get(_K_BUDGET)
         if budget is not None:
             try:
-                transformed['budget_usd'] = float(budget)
+                transformed[_K_BUDGET] = float(budget)
             except (ValueError, TypeError):
-                transformed['budget_usd'] = None
+                transformed[_K_BUDGET] = None
 
         return transformed
 
@@ -123,9 +191,14 @@ class DataTransformer:
         if not isinstance(hire_date, date):
             return None
 
+        # Calendar year difference, minus one if this year's anniversary
+        # hasn't passed yet. Exact across leap years, and pure int
+        # arithmetic — no timedelta allocation like (today - hire_date).
         today = date.today()
-        years = (today - hire_date).days // 365
-        return years
+        return (
+            today.year - hire_date.year
+            - ((today.month, today.day) < (hire_date.month, hire_date.day))
+        )
 
     @staticmethod
     def parse_date(date_value: Any) -> Optional[date]:
@@ -150,14 +223,63 @@ class DataTransformer:
 
         # String parsing (DD/MM/YYYY format from Excel)
         if isinstance(date_value, str):
+            stripped = date_value.strip()
+
+            # Fast path: both accepted formats are fixed-width, so slice
+            # and int() directly instead of probing with strptime (which
+            # costs a raised ValueError for every DD/MM/YYYY input).
+            if len(stripped) == 10:
+                try:
+                    if stripped[4] == '-':  # YYYY-MM-DD
+                        return date(
+                            int(stripped[:4]),
+                            int(stripped[5:7]),
+                            int(stripped[8:10])
+                        )
+                    if stripped[2] == '/':  # DD/MM/YYYY
+                        return date(
+                            int(stripped[6:10]),
+                            int(stripped[3:5]),
+                            int(stripped[:2])
+                        )
+                except ValueError:
+                    return None
+
+            # Fallback for unusual widths (e.g. single-digit day/month)
             try:
-                # Try DD/MM/YYYY format
-                return datetime.strptime(date_value.strip(), "%d/%m/%Y").date()
+                return datetime.strptime(stripped, "%d/%m/%Y").date()
             except ValueError:
                 try:
-                    # Try YYYY-MM-DD format
-                    return datetime.strptime(date_value.strip(), "%Y-%m-%d").date()
+                    return datetime.strptime(stripped, "%Y-%m-%d").date()
                 except ValueError:
                     return None
 
         return None
+
+
+#: Singleton instance, mirroring config_loader's; see get_transformer().
+_transformer_instance: Optional[DataTransformer] = None
+
+
+def get_transformer(config: ConfigLoader) -> DataTransformer:
+    """Get or create the singleton DataTransformer for a config instance.
+
+    Counterpart of get_config_loader(): the transformer's construction
+    cost is re-resolving the exchange rate and department map, so
+    long-lived workers reuse one instance until the config singleton is
+    replaced (a new ConfigLoader instance means the file was re-parsed).
+    The transformer holds no per-batch state, so sharing it across
+    concurrent sheet workers is safe.
+
+    Args:
+        config: ConfigLoader whose rules the transformer should apply.
+
+    Returns:
+        DataTransformer bound to the given config.
+    """
+    global _transformer_instance
+
+    if _transformer_instance is None or _transformer_instance.config is not config:
+        _transformer_instance = DataTransformer(config)
+
+    return _transformer_instance
@@ -1,16 +1,201 @@
 """Data validator for validating Excel row data."""
 
-from typing import Tuple, Optional, Dict, Any
+import sys
+from functools import lru_cache
+from typing import Callable, Tuple, Optional, Dict, Any, List
 from datetime import date
 
+import pandas as pd
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
+
+#: Interned column-name keys, pointer-identical to the interned sheet
+#: headers produced by ExcelReader so per-row dict lookups take CPython's
+#: key-identity fast path.
+_K_EMPLOYEE_ID = sys.intern('employee_id')
+_K_SALARY = sys.intern('salary')
+_K_HIRE_DATE = sys.intern('hire_date')
+_K_PROJECT_ID = sys.intern('project_id')
+_K_BUDGET = sys.intern('budget_usd')
+_K_START_DATE = sys.intern('start_date')
+
+
+class _EmployeeRow(BaseModel):
+    """Pydantic mirror of the employee row checks, for batch validation.
+
+    Same rules as validate_employee(): non-empty employee_id (numeric IDs
+    from Excel are coerced to strings), required numeric salary, optional
+    date hire_date. Extra keys like _excel_row_number are ignored.
+    """
+    model_config = ConfigDict(extra="ignore", coerce_numbers_to_str=True)
+
+    employee_id: str = Field(pattern=r"\S")
+    salary: float
+    hire_date: Optional[date] = None
+
+
+class _ProjectRow(BaseModel):
+    """Pydantic mirror of the project row checks, for batch validation."""
+    model_config = ConfigDict(extra="ignore", coerce_numbers_to_str=True)
+
+    project_id: str = Field(pattern=r"\S")
+    budget_usd: Optional[float] = None
+    start_date: Optional[date] = None
+
+
+#: Batch adapters built once at import; validate_python() runs the whole
+#: row list through pydantic-core's Rust loop in one call instead of a
+#: Python isinstance/try-float ladder per row.
+_EMP_ROW_ADAPTER = TypeAdapter(List[_EmployeeRow])
+_PROJ_ROW_ADAPTER = TypeAdapter(List[_ProjectRow])
+
+
+@lru_cache(maxsize=32)
+def make_required_checker(
+        fields: Tuple[str, ...]
+) -> Callable[[Dict[str, Any]], Tuple[bool, Optional[str]]]:
+    """Build (and memoize) a required-fields checker for a field tuple.
+
+    Call sites pass the same fixed field set for every row, so the
+    closure is built once per distinct tuple and reused; the per-row call
+    then binds fields from the closure instead of re-receiving the list.
+
+    Args:
+        fields: Required field names, as a hashable tuple.
+
+    Returns:
+        Function mapping a row dict to the usual (is_valid, error_message)
+        tuple.
+    """
+    def check(row: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+        missing = [
+            field for field in fields
+            if (value := row.get(field)) is None
+            or (isinstance(value, str) and not value.strip())
+        ]
+        if missing:
+            return False, f"Missing required fields: {', '.join(missing)}"
+        return True, None
+
+    return check
+
+
+def _collect_errors(exc: ValidationError) -> Dict[int, str]:
+    """Convert a batch ValidationError into {row_index: message}.
+
+    Keeps only the first error per row, matching the short-circuit
+    behaviour of the per-row validators.
+    """
+    errors: Dict[int, str] = {}
+    for err in exc.errors(include_url=False):
+        loc = err["loc"]
+        idx = loc[0]
+        if idx in errors:
+            continue
+        field = ".".join(str(part) for part in loc[1:]) or "row"
+        errors[idx] = f"{field}: {err['msg']}"
+    return errors
+
 
 class DataValidator:
     """Validate employee and project data from Excel.
 
     Validates required fields, data types, and business rules.
     Returns (is_valid, error_message) tuples for easy error handling.
+    The batch methods validate a whole sheet in one pydantic-core call
+    and report failures per row index.
     """
 
+    @staticmethod
+    def validate_employees_batch(rows: List[Dict[str, Any]]) -> Dict[int, str]:
+        """Validate all employee rows in one pydantic-core pass.
+
+        Args:
+            rows: List of employee row dictionaries from Excel.
+
+        Returns:
+            Mapping of zero-based row index to error message for every
+            invalid row. Empty dict when all rows are valid.
+        """
+        try:
+            _EMP_ROW_ADAPTER.validate_python(rows)
+            return {}
+        except ValidationError as e:
+            return _collect_errors(e)
+
+    @staticmethod
+    def validate_projects_batch(rows: List[Dict[str, Any]]) -> Dict[int, str]:
+        """Validate all project rows in one pydantic-core pass.
+
+        Args:
+            rows: List of project row dictionaries from Excel.
+
+        Returns:
+            Mapping of zero-based row index to error message for every
+            invalid row. Empty dict when all rows are valid.
+        """
+        try:
+            _PROJ_ROW_ADAPTER.validate_python(rows)
+            return {}
+        except ValidationError as e:
+            return _collect_errors(e)
+
+    @staticmethod
+    def validate_employees_df(df: pd.DataFrame) -> Dict[int, str]:
+        """Columnar validation of an employee sheet via boolean masks.
+
+        Struct-of-arrays counterpart of validate_employees_batch() for the
+        DataFrame pipeline: each rule is one vectorized mask over a column
+        (no per-row dict lookups), and only failing positions are turned
+        back into Python objects.
+
+        Args:
+            df: Raw employee rows as a DataFrame, one column per Excel
+                field.
+
+        Returns:
+            Mapping of zero-based positional row index to error message
+            for every invalid row, first failing rule per row. Empty dict
+            when all rows are valid.
+        """
+        n = len(df)
+        if n == 0:
+            return {}
+
+        if _K_EMPLOYEE_ID in df.columns:
+            emp_id = df[_K_EMPLOYEE_ID]
+            bad_id = emp_id.isna() | (
+                emp_id.astype('string').str.strip().fillna('') == ''
+            )
+        else:
+            bad_id = pd.Series(True, index=df.index)
+
+        if _K_SALARY in df.columns:
+            bad_salary = pd.to_numeric(df[_K_SALARY], errors='coerce').isna()
+        else:
+            bad_salary = pd.Series(True, index=df.index)
+
+        if _K_HIRE_DATE in df.columns:
+            hire = df[_K_HIRE_DATE]
+            bad_hire = hire.notna() & pd.to_datetime(hire, errors='coerce').isna()
+        else:
+            bad_hire = pd.Series(False, index=df.index)
+
+        errors: Dict[int, str] = {}
+        # Rule precedence matches the per-row validator: id, then salary,
+        # then hire_date. Masks are positional (reset index) so callers
+        # can line results up with the original sheet order.
+        bad_id = bad_id.to_numpy()
+        bad_salary = bad_salary.to_numpy()
+        bad_hire = bad_hire.to_numpy()
+        for idx in (bad_id | bad_salary | bad_hire).nonzero()[0]:
+            if bad_id[idx]:
+                errors[int(idx)] = "employee_id is required"
+            elif bad_salary[idx]:
+                errors[int(idx)] = "salary is required and must be numeric"
+            else:
+                errors[int(idx)] = "hire_date must be a date"
+        return errors
+
     @staticmethod
     def validate_employee(row: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
         """Validate employee row data.
@@ -27,9 +212,13 @@ class DataValidator:
             - employee_id is present and non-empty
             - salary is present and numeric
             - hire_date is a date object (if present)
+
+        Note:
+            Prefer validate_employees_batch() for whole sheets; this
+            per-row form remains for single-row callers.
         """
         # Check employee_id exists
-        employee_id = row.get("employee_id")
+        employee_id = row.get(_K_EMPLOYEE_ID)
         if not employee_id:
             return False, "employee_id is required"
 
@@ -38,7 +227,7 @@ class DataValidator:
             return False, "employee_id cannot be empty"
 
         # Validate salary is required and numeric
-        salary = row.get("salary")
+        salary = row.get(_K_SALARY)
         if salary is None or salary == '':
             return False, "salary is required"
 
@@ -49,7 +238,7 @@ class DataValidator:
                 return False, f"salary must be numeric, got: {salary}"
 
         # Validate hire_date (if present)
-        hire_date = row.get("hire_date")
+        hire_date = row.get(_K_HIRE_DATE)
         if hire_date is not None:
             if not isinstance(hire_date, date):
                 return False, f"hire_date must be a date, got: {type(hire_date).__name__}"
@@ -70,9 +259,13 @@ class DataValidator:
             - project_id is present and non-empty
             - budget_usd is numeric (if present)
             - start_date is a date object (if present)
+
+        Note:
+            Prefer validate_projects_batch() for whole sheets; this
+            per-row form remains for single-row callers.
         """
         # Check project_id exists
-        project_id = row.get("project_id")
+        project_id = row.get(_K_PROJECT_ID)
         if not project_id:
             return False, "project_id is required"
 
@@ -81,7 +274,7 @@ class DataValidator:
             return False, "project_id cannot be empty"
 
         # Validate budget_usd (if present)
-        budget_usd = row.get("budget_usd")
+        budget_usd = row.get(_K_BUDGET)
         if budget_usd is not None:
             if not isinstance(budget_usd, (int, float)):
                 try:
@@ -90,7 +283,7 @@ class DataValidator:
                     return False, f"budget_usd must be numeric, got: {budget_usd}"
 
         # Validate start_date (if present)
-        start_date = row.get("start_date")
+        start_date = row.get(_K_START_DATE)
         if start_date is not None:
             if not isinstance(start_date, date):
                 return False, f"start_date must be a date, got: {type(start_date).__name__}"
@@ -110,15 +303,9 @@ class DataValidator:
 
         Returns:
             Tuple of (is_valid, error_message)
-        """
-        missing_fields = []
-
-        for field in required_fields:
-            value = row.get(field)
-            if value is None or (isinstance(value, str) and not value.strip()):
-                missing_fields.append(field)
 
-        if missing_fields:
-            return False, f"Missing required fields: {', '.join(missing_fields)}"
-
-        return True, None
+        Note:
+            Delegates to make_required_checker(); loops over many rows
+            should grab the memoized checker once and call it directly.
+        """
+        return make_required_checker(tuple(required_fields))(row)
@@ -1,10 +1,19 @@
 """Excel file reader for processing uploaded .xlsx files."""
 
+import sys
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import Iterator, List, Dict, Optional, Any, Tuple
 from datetime import datetime, date
 import openpyxl
-from openpyxl.worksheet.worksheet import Worksheet
+import pandas as pd
+
+try:
+    # Rust-based reader, typically several times faster than openpyxl's
+    # pure-Python XML parsing. Optional: everything falls back to openpyxl
+    # read-only streaming when it isn't installed.
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
 
 
 class ExcelReader:
@@ -12,6 +21,8 @@ class ExcelReader:
 
     Handles reading Excel files (.xlsx, .xlsm) and converting them to
     structured data with proper type handling for dates, numbers, etc.
+    Parsing uses python-calamine when available and falls back to openpyxl
+    in read-only mode otherwise; both feed the same row pipeline.
 
     Usage:
         reader = ExcelReader("path/to/file.xlsx")
@@ -37,8 +48,31 @@ class ExcelReader:
         if not self.file_path.suffix.lower() in ['.xlsx', '.xlsm', '.xls']:
             raise ValueError(f"Invalid Excel file format: {self.file_path.suffix}")
 
+        self.workbook = None
+        self._calamine = None
+        # Caches for workbook metadata that callers re-request: sheetnames
+        # walks workbook XML in openpyxl read-only mode, and headers cost
+        # a sheet re-parse there, so both are resolved at most once.
+        self._sheet_names: Optional[List[str]] = None
+        self._header_cache: Dict[str, List[Optional[str]]] = {}
+
+        if CalamineWorkbook is not None:
+            try:
+                self._calamine = CalamineWorkbook.from_path(str(self.file_path))
+                return
+            except Exception:
+                # Fall through to openpyxl; it produces the better error
+                # message for genuinely broken files.
+                self._calamine = None
+
         try:
-            self.workbook = openpyxl.load_workbook(file_path, data_only=True)
+            # read_only streams sheets through openpyxl's SAX parser on
+            # demand instead of materializing the whole cell model up
+            # front — load time and memory stay proportional to what is
+            # actually iterated, not workbook size.
+            self.workbook = openpyxl.load_workbook(
+                file_path, data_only=True, read_only=True
+            )
         except Exception as e:
             raise ValueError(f"Failed to load Excel file: {e}")
 
@@ -52,7 +86,12 @@ class ExcelReader:
             >>> reader.get_sheet_names()
             ['Employees', 'Projects']
         """
-        return self.workbook.sheetnames
+        if self._sheet_names is None:
+            self._sheet_names = list(
+                self._calamine.sheet_names if self._calamine is not None
+                else self.workbook.sheetnames
+            )
+        return self._sheet_names
 
     def has_sheet(self, sheet_name: str) -> bool:
         """Check if sheet exists in workbook.
@@ -63,33 +102,60 @@ class ExcelReader:
         Returns:
             True if sheet exists, False otherwise
         """
-        return sheet_name in self.workbook.sheetnames
+        return sheet_name in self.get_sheet_names()
+
+    def _iter_sheet_rows(self, sheet_name: str) -> Iterator[Tuple[Any, ...]]:
+        """Yield raw value tuples for a sheet, header row first.
 
-    def read_sheet(self, sheet_name: str) -> List[Dict[str, Any]]:
-        """Read sheet and return list of dictionaries.
+        Backend-neutral row source for read_sheet()/read_sheet_df():
+        calamine returns fully-typed Python values in one shot, openpyxl
+        streams them. Calamine trims trailing empty cells per row, so rows
+        are padded back to uniform width here.
+
+        Args:
+            sheet_name: Name of sheet to iterate (must exist)
+        """
+        if self._calamine is not None:
+            data = self._calamine.get_sheet_by_name(sheet_name).to_python()
+            width = max(map(len, data), default=0)
+            pad = (None,) * width
+            for row in data:
+                yield tuple(row) + pad[len(row):]
+        else:
+            yield from self.workbook[sheet_name].iter_rows(values_only=True)
+
+    def read_sheet(
+            self, sheet_name: str
+    ) -> Tuple[List[Dict[str, Any]], List[int]]:
+        """Read sheet and return row dictionaries plus their Excel rows.
 
         First row is treated as headers. Subsequent rows are data.
-        Automatically converts Excel dates to Python date objects.
+        Automatically converts Excel dates to Python date objects. Excel
+        row numbers live in a parallel list instead of a metadata key
+        inside each dict, so the payload dicts hold business fields only
+        and flow into the Create schemas without an extra key to ignore.
 
         Args:
             sheet_name: Name of sheet to read
 
         Returns:
-            List of dictionaries, one per row
+            Tuple of (rows, row_numbers): row dictionaries and, at the
+            same positions, their 1-based Excel row numbers for error
+            reporting.
 
         Raises:
             ValueError: If sheet doesn't exist or has no data
 
         Example:
-            >>> data = reader.read_sheet("Employees")
-            >>> data[0]
-            {
+            >>> rows, row_numbers = reader.read_sheet("Employees")
+            >>> rows[0], row_numbers[0]
+            ({
                 'employee_id': 'E0001',
                 'name': 'Kevin Davis',
                 'department_code': 'DEV',
                 'salary': 78289.0,
                 'hire_date': date(2023, 4, 5)
-            }
+            }, 2)
         """
         if not self.has_sheet(sheet_name):
             raise ValueError(
@@ -97,49 +163,121 @@ class ExcelReader:
                 f"Available sheets: {', '.join(self.get_sheet_names())}"
             )
 
-        sheet = self.workbook[sheet_name]
-
-        # Get headers from first row
-        headers = self._get_headers(sheet)
+        # One streamed pass over the sheet: the first yielded row is the
+        # header, the rest are data. A separate header pass would re-parse
+        # the sheet in the openpyxl read-only backend.
+        rows = self._iter_sheet_rows(sheet_name)
+        headers = self._headers_from_row(next(rows, ()))
+        self._header_cache[sheet_name] = headers
 
-        if not headers:
+        if not any(headers):
             raise ValueError(f"Sheet '{sheet_name}' has no headers in first row")
 
-        # Read data rows
+        # Positions of named columns, resolved once so the row loop skips
+        # the per-row zip and None-header checks.
+        header_idx = [(i, h) for i, h in enumerate(headers) if h]
+        clean = self._clean_cell_value
+
+        # Read data rows. Emptiness detection is fused into the dict
+        # build: clean() already normalizes ''/whitespace to None, so one
+        # pass both converts the cells and decides whether the row has any
+        # content — no separate all()-scan per row.
         data = []
-        for row_num, row in enumerate(sheet.iter_rows(min_row=2, values_only=True), start=2):
+        data_append = data.append
+        row_numbers: List[int] = []
+        rows_append = row_numbers.append
+        for row_num, row in enumerate(rows, start=2):
+            row_dict = {}
+            has_value = False
+            for i, h in header_idx:
+                value = clean(row[i])
+                row_dict[h] = value
+                if value is not None:
+                    has_value = True
+
             # Skip completely empty rows
-            if all(cell is None for cell in row):
+            if not has_value:
                 continue
 
-            # Create dictionary from headers and values
-            row_dict = {}
-            for header, value in zip(headers, row):
-                if header:  # Skip None headers
-                    row_dict[header] = self._clean_cell_value(value)
+            data_append(row_dict)
+            rows_append(row_num)
+
+        return data, row_numbers
+
+    def read_sheet_df(self, sheet_name: str) -> pd.DataFrame:
+        """Read sheet as a DataFrame, filling columns during streaming.
+
+        Columnar counterpart of read_sheet() for the vectorized pipeline:
+        cell values append to per-column lists as the sheet streams, so no
+        per-row dicts are ever allocated. The result carries an
+        _excel_row_number column for error reporting, like the row path.
+
+        Args:
+            sheet_name: Name of sheet to read
+
+        Returns:
+            DataFrame with one column per named header plus
+            _excel_row_number. Completely empty rows are skipped.
+
+        Raises:
+            ValueError: If sheet doesn't exist or has no headers
+        """
+        if not self.has_sheet(sheet_name):
+            raise ValueError(
+                f"Sheet '{sheet_name}' not found. "
+                f"Available sheets: {', '.join(self.get_sheet_names())}"
+            )
 
-            # Add row number for error tracking
-            row_dict['_excel_row_number'] = row_num
+        rows = self._iter_sheet_rows(sheet_name)
+        headers = self._headers_from_row(next(rows, ()))
+        self._header_cache[sheet_name] = headers
 
-            data.append(row_dict)
+        if not any(headers):
+            raise ValueError(f"Sheet '{sheet_name}' has no headers in first row")
 
-        return data
+        header_idx = [(i, h) for i, h in enumerate(headers) if h]
+        clean = self._clean_cell_value
+
+        columns: Dict[str, list] = {h: [] for _, h in header_idx}
+        row_numbers = []
+        for row_num, row in enumerate(rows, start=2):
+            # Same fused emptiness check as read_sheet(): cells append as
+            # they are cleaned and the rare all-empty row is popped back
+            # off, instead of pre-scanning every row.
+            has_value = False
+            for i, h in header_idx:
+                value = clean(row[i])
+                columns[h].append(value)
+                if value is not None:
+                    has_value = True
+            if not has_value:
+                for _, h in header_idx:
+                    columns[h].pop()
+                continue
+            row_numbers.append(row_num)
 
-    def _get_headers(self, sheet: Worksheet) -> List[Optional[str]]:
-        """Extract headers from first row.
+        columns['_excel_row_number'] = row_numbers
+        return pd.DataFrame(columns)
+
+    @staticmethod
+    def _headers_from_row(first_row) -> List[Optional[str]]:
+        """Clean a raw first-row tuple into header names.
 
         Args:
-            sheet: Worksheet object
+            first_row: Tuple of first-row cell values
 
         Returns:
             List of header names (strings or None)
         """
         headers = []
-        for cell in sheet[1]:
-            value = cell.value
+        for value in first_row:
             if value is not None:
-                # Convert to string and clean
-                header = str(value).strip()
+                # Convert to string and clean. Interning the header makes
+                # it pointer-identical to the interned literals used by the
+                # validator/transformer, so per-row dict lookups hit
+                # CPython's key-identity fast path instead of comparing
+                # string contents.
+                header = sys.intern(str(value).strip())
                 headers.append(header if header else None)
             else:
                 headers.append(None)
@@ -165,15 +303,27 @@ class ExcelReader:
         if value is None:
             return None
 
-        # Handle datetime objects (Excel stores dates as datetime)
-        if isinstance(value, datetime):
-            return value.date()  # Convert to date only
+        # Exact-type dispatch first: this runs once per cell, and almost
+        # every cell is a plain str/float/datetime, so a pointer compare
+        # on type() beats walking isinstance MRO checks.
+        cell_type = type(value)
 
-        # Already a date object
-        if isinstance(value, date):
+        if cell_type is str:
+            stripped = value.strip()
+            return stripped if stripped else None
+
+        # Excel stores dates as datetime; keep the date part only
+        if cell_type is datetime:
+            return value.date()
+
+        if cell_type is date:
             return value
 
-        # Handle strings
+        # Rare: subclasses (e.g. pandas/openpyxl datetime variants)
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
         if isinstance(value, str):
             stripped = value.strip()
             return stripped if stripped else None
@@ -193,9 +343,11 @@ class ExcelReader:
         if not self.has_sheet(sheet_name):
             raise ValueError(f"Sheet '{sheet_name}' not found")
 
-        sheet = self.workbook[sheet_name]
-        # max_row includes header, so subtract 1
-        return max(0, sheet.max_row - 1)
+        # Read-only sheets may lack reliable dimension metadata, so count
+        # by streaming the data rows rather than trusting max_row.
+        rows = self._iter_sheet_rows(sheet_name)
+        next(rows, None)  # header
+        return sum(1 for _ in rows)
 
     def get_column_names(self, sheet_name: str) -> List[str]:
         """Get column names (headers) from sheet.
@@ -209,8 +361,14 @@ class ExcelReader:
         if not self.has_sheet(sheet_name):
             raise ValueError(f"Sheet '{sheet_name}' not found")
 
-        sheet = self.workbook[sheet_name]
-        headers = self._get_headers(sheet)
+        # Served from the header cache when the sheet was already read;
+        # otherwise only the first row is parsed (and cached).
+        headers = self._header_cache.get(sheet_name)
+        if headers is None:
+            headers = self._headers_from_row(
+                next(self._iter_sheet_rows(sheet_name), ())
+            )
+            self._header_cache[sheet_name] = headers
         return [h for h in headers if h is not None]
 
     def validate_required_sheets(self, required_sheets: List[str]) -> None:
@@ -259,8 +417,12 @@ class ExcelReader:
             )
 
     def close(self) -> None:
-        """Close the workbook and release resources."""
-        if hasattr(self, 'workbook'):
+        """Close the workbook and release resources.
+
+        Only the openpyxl backend holds an open zip handle; calamine
+        reads everything up front.
+        """
+        if getattr(self, 'workbook', None) is not None:
             self.workbook.close()
 
     def __enter__(self):
@@ -1,26 +1,356 @@
 """Main Celery task for processing uploaded Excel files."""
 
-import os
+import itertools
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List
+
+from celery.signals import worker_process_init
+from pydantic import TypeAdapter, ValidationError
 
 from backend.celery_app import celery_app
 from backend.core.config import settings
 from backend.core.utils import utcnow
-from backend.db.session import SessionLocal
+from backend.db.session import BULK_BATCH_SIZE, SessionLocal
 from backend.crud.employee_crud import employee_crud
 from backend.crud.project_crud import project_crud
-from backend.crud.upload_job_crud import upload_job_crud
+from backend.crud.upload_job_crud import ProgressAggregator, upload_job_crud
 from backend.schemas.employee import EmployeeCreate
 from backend.schemas.project import ProjectCreate
-from backend.services.config_loader import ConfigLoader
+from backend.services.config_loader import get_config_loader
 from backend.services.excel_reader import ExcelReader
 from backend.services.data_validator import DataValidator
-from backend.services.data_transformer import DataTransformer
+from backend.services.data_transformer import get_transformer
+from backend.services.bulk_copy import COPY_MIN_ROWS
 
 logger = logging.getLogger(__name__)
 
+#: Batch adapters built once at import: one validate_python() call walks a
+#: whole sheet of transformed rows in pydantic-core instead of crossing
+#: into Rust once per EmployeeCreate(**row).
+_EMP_CREATE_LIST = TypeAdapter(List[EmployeeCreate])
+_PROJ_CREATE_LIST = TypeAdapter(List[ProjectCreate])
+
+
+@worker_process_init.connect
+def _warm_caches(**kwargs):
+    """Preload the config and transformer singletons at worker boot.
+
+    Without this the first task in every forked worker process pays the
+    config.csv parse and transformer setup. A failed preload is only
+    logged — the task itself retries the load and turns a genuinely
+    broken config into a proper job failure.
+    """
+    try:
+        get_transformer(get_config_loader())
+    except Exception as e:
+        logger.warning(f"Config preload at worker boot failed: {e}")
+
+
+def _build_creates(adapter, rows, *, key_field, sheet, job_id, error_details):
+    """Validate transformed rows into Create schemas in one batch call.
+
+    The happy path is a single adapter.validate_python() over the whole
+    list. If any row fails, the failing indices are reported individually
+    (matching the old per-row construction loop) and the remainder is
+    re-validated in a second batch call.
+
+    Args:
+        adapter: TypeAdapter over List[CreateSchema].
+        rows: Transformed row dicts for one sheet.
+        key_field: Business-key field used in error reports.
+        sheet: Sheet name for error reports.
+        job_id: Upload job ID for log prefixes.
+        error_details: Mutable error dict; per-row failures are appended.
+
+    Returns:
+        Tuple of (creates, failed_count).
+    """
+    if not rows:
+        return [], 0
+
+    try:
+        return adapter.validate_python(rows), 0
+    except ValidationError as exc:
+        bad = {err["loc"][0] for err in exc.errors(include_url=False)}
+
+    for idx in sorted(bad):
+        key = rows[idx].get(key_field, 'unknown')
+        logger.error(f"[Job {job_id}] Invalid {sheet} row {key}")
+        error_details["errors"].append({
+            "kind": "schema",
+            "sheet": sheet,
+            "row": key,
+            "error": "Row failed schema validation after transformation"
+        })
+
+    good = [row for idx, row in enumerate(rows) if idx not in bad]
+    return (adapter.validate_python(good) if good else []), len(bad)
+
+
+def _persist_batch(db, crud, creates, *, key_field, sheet, job_id, error_details, progress=None):
+    """Upsert schemas in committed chunks, isolating failures per chunk.
+
+    Sheets below COPY_MIN_ROWS are written in BULK_BATCH_SIZE chunks with
+    one statement and one commit each, so a constraint violation only
+    rolls back — and retries row by row — the chunk it lives in, while
+    already-committed chunks stay durable. Very large sheets go through
+    upsert_many()'s COPY staging path in one transaction instead, where
+    per-chunk commits would defeat the single-merge design.
+
+    Args:
+        db: Database session.
+        crud: CRUD instance exposing upsert_many() and upsert().
+        creates: List of validated Create schemas.
+        key_field: Business-key attribute used in error reports.
+        sheet: Sheet name for error reports.
+        job_id: Upload job ID for log prefixes.
+        error_details: Mutable error dict; per-row failures are appended.
+        progress: Optional ProgressAggregator ticked as rows are written.
+
+    Returns:
+        Number of rows successfully written.
+    """
+    if not creates:
+        return 0
+
+    if len(creates) >= COPY_MIN_ROWS:
+        try:
+            saved = crud.upsert_many(db, objs_in=creates)
+            if progress is not None:
+                progress.tick(saved)
+            return saved
+        except Exception as e:
+            db.rollback()
+            logger.warning(
+                f"[Job {job_id}] COPY upsert failed for {sheet}, "
+                f"falling back to chunked inserts: {e}"
+            )
+
+    saved = 0
+    it = iter(creates)
+    while chunk := list(itertools.islice(it, BULK_BATCH_SIZE)):
+        try:
+            n = crud.upsert_many(db, objs_in=chunk)
+            saved += n
+            if progress is not None:
+                progress.tick(n)
+            continue
+        except Exception as e:
+            db.rollback()
+            logger.warning(
+                f"[Job {job_id}] Chunk upsert failed for {sheet}, "
+                f"retrying chunk per row: {e}"
+            )
+
+        for obj_in in chunk:
+            try:
+                crud.upsert(db, obj_in=obj_in)
+                saved += 1
+                if progress is not None:
+                    progress.tick()
+            except Exception as e:
+                db.rollback()
+                key = getattr(obj_in, key_field, 'unknown')
+                logger.error(f"[Job {job_id}] Failed to save {key}: {e}")
+                error_details["errors"].append({
+                    "kind": "database",
+                    "sheet": sheet,
+                    "row": key,
+                    "error": f"Database error: {str(e)}"
+                })
+    return saved
+
+
+def _process_employee_sheet(job_id, employees_df, config):
+    """Validate, transform and persist the Employees sheet.
+
+    Runs as one arm of the sheet fan-out in process_upload_task(), so it
+    opens its own session (sessions are not thread-safe) and its own
+    progress aggregator. The sheet data is already materialized by the
+    caller; workbook handles never cross threads.
+
+    Args:
+        job_id: Upload job ID for log prefixes and progress updates.
+        employees_df: Raw Employees sheet from read_sheet_df().
+        config: Shared ConfigLoader (read-only after construction).
+
+    Returns:
+        Tuple of (saved_count, error_entries, error_count).
+    """
+    error_details = {"errors": []}
+    error_count = 0
+
+    # Columnar pipeline: validation is a handful of masks, the transforms
+    # are vectorized column ops, and rows only materialize as dicts at
+    # the persistence boundary. Bad inputs inside valid rows coerce to
+    # nulls rather than raising, so the row-level "transformation error"
+    # case no longer exists here.
+    employee_errors = DataValidator.validate_employees_df(employees_df)
+    for idx, error_msg in sorted(employee_errors.items()):
+        excel_row = int(employees_df['_excel_row_number'].iat[idx])
+        error_details["errors"].append({
+            "kind": "validation",
+            "sheet": "Employees",
+            "row": excel_row,
+            "error": error_msg
+        })
+        error_count += 1
+        logger.warning(f"[Job {job_id}] Employee row {excel_row} validation failed: {error_msg}")
+
+    valid_df = (
+        employees_df.drop(employees_df.index[list(employee_errors)])
+        if employee_errors else employees_df
+    )
+    transformed_df = get_transformer(config).transform_employees_df(valid_df)
+    # NaN/NaT → None so the records validate like row-path output.
+    transformed_df = transformed_df.astype(object).where(
+        transformed_df.notna(), None
+    )
+    db = SessionLocal()
+    try:
+        progress = ProgressAggregator(db, job_id, flush_every=1000)
+
+        # COPY-scale sheets stream straight from the DataFrame into the
+        # staging COPY — no dict records, no per-row schemas. The values
+        # are trusted vectorized-pipeline output; anything that still
+        # fails falls back to the validated batch path below.
+        if (
+            len(transformed_df) >= COPY_MIN_ROWS
+            and db.get_bind().dialect.name == "postgresql"
+        ):
+            try:
+                saved = employee_crud.upsert_df(db, df=transformed_df)
+                progress.tick(saved)
+                progress.flush()
+                return saved, error_details["errors"], error_count
+            except Exception as e:
+                db.rollback()
+                logger.warning(
+                    f"[Job {job_id}] DataFrame COPY upsert failed for "
+                    f"Employees, falling back to schema path: {e}"
+                )
+
+        processed_employees = transformed_df.to_dict(orient='records')
+
+        employee_creates, failed = _build_creates(
+            _EMP_CREATE_LIST, processed_employees,
+            key_field="employee_id", sheet="Employees",
+            job_id=job_id, error_details=error_details
+        )
+        error_count += failed
+
+        saved = _persist_batch(
+            db, employee_crud, employee_creates,
+            key_field="employee_id", sheet="Employees",
+            job_id=job_id, error_details=error_details, progress=progress
+        )
+        progress.flush()
+    finally:
+        db.close()
+
+    error_count += len(employee_creates) - saved
+    return saved, error_details["errors"], error_count
+
+
+def _process_project_sheet(job_id, projects_data, row_numbers, config):
+    """Validate, transform and persist the Projects sheet.
+
+    Row-path counterpart of _process_employee_sheet() for the other arm
+    of the fan-out; same session/progress ownership rules apply.
+
+    Args:
+        job_id: Upload job ID for log prefixes and progress updates.
+        projects_data: Raw Projects rows from read_sheet().
+        row_numbers: Excel row numbers parallel to projects_data.
+        config: Shared ConfigLoader (read-only after construction).
+
+    Returns:
+        Tuple of (saved_count, error_entries, error_count).
+    """
+    error_details = {"errors": []}
+    error_count = 0
+
+    transformer = get_transformer(config)
+    processed_projects = []
+
+    project_errors = DataValidator.validate_projects_batch(projects_data)
+    for idx, (row, excel_row) in enumerate(zip(projects_data, row_numbers)):
+        error_msg = project_errors.get(idx)
+        if error_msg is not None:
+            error_details["errors"].append({
+                "kind": "validation",
+                "sheet": "Projects",
+                "row": excel_row,
+                "error": error_msg
+            })
+            error_count += 1
+            logger.warning(f"[Job {job_id}] Project row {excel_row} validation failed: {error_msg}")
+            continue
+
+        try:
+            transformed = transformer.transform_project(row)
+            processed_projects.append(transformed)
+        except Exception as e:
+            error_details["errors"].append({
+                "kind": "transform",
+                "sheet": "Projects",
+                "row": excel_row,
+                "error": f"Transformation error: {str(e)}"
+            })
+            error_count += 1
+            logger.warning(f"[Job {job_id}] Project row {excel_row} transformation failed: {e}")
+
+    project_creates, failed = _build_creates(
+        _PROJ_CREATE_LIST, processed_projects,
+        key_field="project_id", sheet="Projects",
+        job_id=job_id, error_details=error_details
+    )
+    error_count += failed
+
+    db = SessionLocal()
+    try:
+        progress = ProgressAggregator(db, job_id, flush_every=1000)
+        saved = _persist_batch(
+            db, project_crud, project_creates,
+            key_field="project_id", sheet="Projects",
+            job_id=job_id, error_details=error_details, progress=progress
+        )
+        progress.flush()
+    finally:
+        db.close()
+
+    error_count += len(project_creates) - saved
+    return saved, error_details["errors"], error_count
+
+
+@celery_app.task(ignore_result=True)
+def cleanup_upload_file(job_id: str, file_path: str):
+    """Delete a processed upload file.
 
-@celery_app.task(bind=True)
+    Runs as a follow-up task chained after the final status commit, so
+    process_upload_task returns without blocking on the unlink. The
+    missing_ok form replaces the exists-check + remove pair: one syscall
+    and no window for the file to vanish between the two.
+
+    Args:
+        job_id: Upload job ID, for log prefixes only.
+        file_path: Absolute path of the file to delete.
+    """
+    try:
+        Path(file_path).unlink(missing_ok=True)
+        logger.info(f"[Job {job_id}] Cleaned up file: {file_path}")
+    except OSError as e:
+        logger.warning(f"[Job {job_id}] Failed to clean up file: {e}")
+
+
+@celery_app.task(
+    bind=True,
+    rate_limit="12/s",  # Per-worker cap so upload bursts can't stampede the DB
+    max_retries=3,
+    retry_backoff=True,
+)
 def process_upload_task(self, job_id: str, file_path: str):
     """Main upload processing task."""
     db = SessionLocal()
@@ -33,18 +363,19 @@ def process_upload_task(self, job_id: str, file_path: str):
             logger.error(f"[Job {job_id}] Job not found in database")
             return
 
+        # update() commits internally; no refresh needed, the in-memory
+        # object already reflects exactly what was written.
         job = upload_job_crud.update(db, db_obj=job, obj_in={
             "status": "processing",
             "current_step": "reading",
             "started_at": utcnow()
         })
-        db.commit()
-        db.refresh(job)
 
-        # Load configuration
+        # Load configuration (cached across tasks; re-parsed only when
+        # config.csv changes on disk)
         logger.info(f"[Job {job_id}] Loading configuration")
         try:
-            config = ConfigLoader()
+            config = get_config_loader()
         except Exception as e:
             raise ValueError(f"Failed to load config.csv: {e}")
 
@@ -55,12 +386,14 @@ def process_upload_task(self, job_id: str, file_path: str):
         try:
             with ExcelReader(str(full_file_path)) as reader:
                 reader.validate_required_sheets(["Employees", "Projects"])
-                employees_data = reader.read_sheet("Employees")
-                projects_data = reader.read_sheet("Projects")
+                # Employees go through the columnar pipeline; projects
+                # keep the row path (their transform is a single cast).
+                employees_df = reader.read_sheet_df("Employees")
+                projects_data, project_row_numbers = reader.read_sheet("Projects")
 
-                total_rows = len(employees_data) + len(projects_data)
+                total_rows = len(employees_df) + len(projects_data)
                 logger.info(
-                    f"[Job {job_id}] Read {len(employees_data)} employees, "
+                    f"[Job {job_id}] Read {len(employees_df)} employees, "
                     f"{len(projects_data)} projects"
                 )
         except Exception as e:
@@ -70,147 +403,45 @@ def process_upload_task(self, job_id: str, file_path: str):
             "total_rows": total_rows,
             "current_step": "validating"
         })
-        db.commit()
-        db.refresh(job)
-
-        # Validate and Transform Data
-        logger.info(f"[Job {job_id}] Validating and transforming data")
-
-        validator = DataValidator()
-        transformer = DataTransformer(config)
-
-        processed_employees = []
-        processed_projects = []
-        error_details = {"errors": []}
-        error_count = 0
-
-        # Process employees
-        for idx, row in enumerate(employees_data, start=1):
-            excel_row = row.get('_excel_row_number', idx + 1)
-
-            is_valid, error_msg = validator.validate_employee(row)
-            if not is_valid:
-                error_details["errors"].append({
-                    "sheet": "Employees",
-                    "row": excel_row,
-                    "error": error_msg
-                })
-                error_count += 1
-                logger.warning(f"[Job {job_id}] Employee row {excel_row} validation failed: {error_msg}")
-                continue
 
-            try:
-                transformed = transformer.transform_employee(row)
-                processed_employees.append(transformed)
-            except Exception as e:
-                error_details["errors"].append({
-                    "sheet": "Employees",
-                    "row": excel_row,
-                    "error": f"Transformation error: {str(e)}"
-                })
-                error_count += 1
-                logger.warning(f"[Job {job_id}] Employee row {excel_row} transformation failed: {e}")
-
-        # Process projects
-        for idx, row in enumerate(projects_data, start=1):
-            excel_row = row.get('_excel_row_number', idx + 1)
-
-            is_valid, error_msg = validator.validate_project(row)
-            if not is_valid:
-                error_details["errors"].append({
-                    "sheet": "Projects",
-                    "row": excel_row,
-                    "error": error_msg
-                })
-                error_count += 1
-                logger.warning(f"[Job {job_id}] Project row {excel_row} validation failed: {error_msg}")
-                continue
-
-            try:
-                transformed = transformer.transform_project(row)
-                processed_projects.append(transformed)
-            except Exception as e:
-                error_details["errors"].append({
-                    "sheet": "Projects",
-                    "row": excel_row,
-                    "error": f"Transformation error: {str(e)}"
-                })
-                error_count += 1
-                logger.warning(f"[Job {job_id}] Project row {excel_row} transformation failed: {e}")
-
-        logger.info(
-            f"[Job {job_id}] Validation complete. "
-            f"Valid: {len(processed_employees)} employees, {len(processed_projects)} projects. "
-            f"Errors: {error_count}"
-        )
-
-        # Persist to database
-        logger.info(f"[Job {job_id}] Persisting data to database")
+        # Validate, transform and persist both sheets concurrently. The
+        # pipelines are independent until the final job update, so the
+        # employee insert round trips overlap with project work; each
+        # worker uses its own session and progress aggregator.
+        logger.info(f"[Job {job_id}] Processing sheets in parallel")
 
         job = upload_job_crud.update(db, db_obj=job, obj_in={
-            "current_step": "persisting",
-            "processed_rows": len(processed_employees) + len(processed_projects),
-            "error_rows": error_count
+            "current_step": "persisting"
         })
-        db.commit()
-        db.refresh(job)
-
-        # Save employees with individual error handling and commit
-        saved_employees = 0
-        for emp_data in processed_employees:
-            try:
-                employee_create = EmployeeCreate(**emp_data)
-                employee, was_created = employee_crud.upsert(db, obj_in=employee_create)
-                db.commit()
-                saved_employees += 1
 
-                action = "created" if was_created else "updated"
-                logger.debug(f"[Job {job_id}] Employee {emp_data.get('employee_id')} {action}")
-
-            except Exception as e:
-                db.rollback()
-                error_count += 1
-                emp_id = emp_data.get('employee_id', 'unknown')
-                logger.error(f"[Job {job_id}] Failed to save employee {emp_id}: {e}")
-                error_details["errors"].append({
-                    "sheet": "Employees",
-                    "row": emp_id,
-                    "error": f"Database error: {str(e)}"
-                })
-
-        # Save projects with individual error handling and commit
-        saved_projects = 0
-        for proj_data in processed_projects:
-            try:
-                project_create = ProjectCreate(**proj_data)
-                project, was_created = project_crud.upsert(db, obj_in=project_create)
-                db.commit()
-                saved_projects += 1
-
-                action = "created" if was_created else "updated"
-                logger.debug(f"[Job {job_id}] Project {proj_data.get('project_id')} {action}")
-
-            except Exception as e:
-                db.rollback()
-                error_count += 1
-                proj_id = proj_data.get('project_id', 'unknown')
-                logger.error(f"[Job {job_id}] Failed to save project {proj_id}: {e}")
-                error_details["errors"].append({
-                    "sheet": "Projects",
-                    "row": proj_id,
-                    "error": f"Database error: {str(e)}"
-                })
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            emp_future = pool.submit(
+                _process_employee_sheet, job_id, employees_df, config
+            )
+            proj_future = pool.submit(
+                _process_project_sheet, job_id, projects_data,
+                project_row_numbers, config
+            )
+            saved_employees, emp_errors, emp_error_count = emp_future.result()
+            saved_projects, proj_errors, proj_error_count = proj_future.result()
+
+        # Each error entry carries a "kind" tag (validation / transform /
+        # schema / database) so consumers can branch on the category
+        # directly instead of pattern-matching message text.
+        error_details = {"errors": emp_errors + proj_errors}
+        error_count = emp_error_count + proj_error_count
 
         logger.info(
             f"[Job {job_id}] Persistence complete. "
             f"Saved: {saved_employees} employees, {saved_projects} projects. "
-            f"Failed: {error_count - (len(processed_employees) + len(processed_projects) - saved_employees - saved_projects)}"
+            f"Errors: {error_count}"
         )
 
         # Complete successfully
         logger.info(f"[Job {job_id}] Processing completed successfully")
 
-        db.refresh(job)
+        # Single final UPDATE reconciles everything, including the absolute
+        # processed_rows count on top of the workers' delta updates.
         job = upload_job_crud.update(db, db_obj=job, obj_in={
             "status": "completed",
             "current_step": "completed",
@@ -219,16 +450,10 @@ def process_upload_task(self, job_id: str, file_path: str):
             "error_rows": error_count,
             "completed_at": utcnow()
         })
-        db.commit()
-        db.refresh(job)
 
-        # Clean up file
-        try:
-            if os.path.exists(full_file_path):
-                os.remove(full_file_path)
-                logger.info(f"[Job {job_id}] Cleaned up file: {full_file_path}")
-        except Exception as e:
-            logger.warning(f"[Job {job_id}] Failed to clean up file: {e}")
+        # File cleanup runs as its own lightweight task so this one can
+        # acknowledge completion without waiting on filesystem syscalls.
+        cleanup_upload_file.delay(job_id, str(full_file_path))
 
         logger.info(
             f"[Job {job_id}] Final stats - "
@@ -248,8 +473,6 @@ def process_upload_task(self, job_id: str, file_path: str):
                     "error_message": str(e),
                     "completed_at": utcnow()
                 })
-                db.commit()
-                db.refresh(job)
         except Exception as update_error:
             logger.error(f"[Job {job_id}] Failed to update job status: {update_error}", exc_info=True)
 